@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     # Application Configuration
     frontend_url: str = os.getenv("FRONTEND_URL", "http://localhost:3000")
     backend_url: str = os.getenv("BACKEND_URL", "http://localhost:8000")
+    # Root log level; set LOG_LEVEL=DEBUG to see agent state and tool payloads
+    log_level: str = os.getenv("LOG_LEVEL", "INFO").upper()
 
     # AI Agent Configuration
     openrouter_api_key: Optional[str] = os.getenv("OPENROUTER_API_KEY")
@@ -36,6 +38,8 @@ class Settings(BaseSettings):
     openrouter_referer: Optional[str] = os.getenv("OPENROUTER_SITE_URL")
     openrouter_title: Optional[str] = os.getenv("OPENROUTER_SITE_NAME")
     tavily_api_key: Optional[str] = os.getenv("TAVILY_API_KEY")
+    # Concurrent agent runs per process before new chats wait, then get a 503
+    agent_max_concurrency: int = int(os.getenv("AGENT_MAX_CONCURRENCY", "16"))
 
     # LangSmith tracing configuration
     langsmith_api_key: Optional[str] = os.getenv("LANGSMITH_API_KEY")
@@ -49,6 +53,8 @@ class Settings(BaseSettings):
     # Redis Configuration for token caching
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     redis_enabled: bool = os.getenv("REDIS_ENABLED", "true").lower() == "true"
+    # Backend for Spotify tool result caches: "memory" (per process) or "redis"
+    tool_cache_backend: str = os.getenv("TOOL_CACHE_BACKEND", "memory").lower()
 
     # Spotify API URLs
     spotify_token_url: str = "https://accounts.spotify.com/api/token"
@@ -1,7 +1,10 @@
 from __future__ import annotations
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
+import asyncio
 import json
-import os
+import logging
 
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import StateGraph, START, END
@@ -11,52 +14,27 @@ from langchain_openai import ChatOpenAI
 from langgraph.errors import NodeInterrupt
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
-from langmem.short_term import summarize_messages, RunningSummary
-
-# Summarization constants
-SUMMARIZATION_MAX_TOKENS = 10000  # Maximum tokens in final output after summarization
-SUMMARIZATION_TRIGGER_TOKENS = 10000  # Token threshold to trigger summarization
-SUMMARIZATION_MAX_SUMMARY_TOKENS = 256  # Maximum tokens for the summary itself
 
 from .tools import tools
-from .state import AgentState
+from .memory import (
+    CACHE_RESET_TURNS,
+    CompactionResult,
+    SUMMARIZATION_MAX_SUMMARY_TOKENS,
+    acompress_history,
+    apply_running_summary,
+)
+from .state import AgentState, get_session_caches
 from .prompts import build_system_prompt
+from .tracing import traceable
 from ..core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Import and configure LangSmith tracing
-try:
-    from langsmith import traceable
-    from langsmith import Client as LangSmithClient
-
-    # Initialize LangSmith client if API key is available
-    langsmith_client = None
-    if (
-        os.getenv("LANGSMITH_API_KEY")
-        and os.getenv("LANGSMITH_TRACING_ENABLED", "true").lower() == "true"
-    ):
-        langsmith_client = LangSmithClient(
-            api_key=os.getenv("LANGSMITH_API_KEY"),
-            api_url=os.getenv("LANGSMITH_API_URL", "https://api.smith.langchain.com"),
-        )
-        # Set environment variables for automatic tracing
-        os.environ["LANGCHAIN_TRACING_V2"] = "true"
-        os.environ["LANGCHAIN_PROJECT"] = os.getenv(
-            "LANGSMITH_PROJECT", "spotify-ai-playlist-generator"
-        )
-        print("✅ LangSmith tracing initialized")
-    else:
-        print("ℹ️  LangSmith tracing disabled - no API key provided")
-
-except ImportError:
-    print("⚠️  LangSmith not available - install langsmith package for tracing")
-    traceable = lambda func: func  # No-op decorator
-    langsmith_client = None
-
 
 class AnyArgsSchema(BaseModel):
     class Config:
@@ -74,27 +52,48 @@ class FrontendTool(BaseTool):
         raise NodeInterrupt("This is a frontend tool call")
 
 
+def _frontend_tool_names(config) -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            tool["name"] if isinstance(tool, dict) else tool.name
+            for tool in config["configurable"].get("frontend_tools", [])
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_tools(frontend_tool_names: tuple[str, ...]):
+    """Build the tool list and its ToolNode once per set of frontend tools."""
+    tool_list = tools + [FrontendTool(name) for name in frontend_tool_names]
+    return tool_list, ToolNode(tool_list)
+
+
 def get_tool_defs(config):
-    frontend_tools = [
-        {"type": "function", "function": tool}
-        for tool in config["configurable"].get("frontend_tools", [])
-    ]
-    return tools + frontend_tools
+    frontend_tools = config["configurable"].get("frontend_tools")
+    if not frontend_tools:
+        return tools
+    return tools + [{"type": "function", "function": tool} for tool in frontend_tools]
 
 
 def get_tools(config):
-    frontend_tools = [
-        FrontendTool(tool.name)
-        for tool in config["configurable"].get("frontend_tools", [])
-    ]
-    return tools + frontend_tools
+    return _build_tools(_frontend_tool_names(config))[0]
 
 
-def _maybe_playlist_id(msg: ToolMessage) -> Optional[str]:
-    import logging
+def get_tool_node(config) -> ToolNode:
+    return _build_tools(_frontend_tool_names(config))[1]
+
+
+@lru_cache(maxsize=1)
+def _default_system_prompt(today: date) -> str:
+    return build_system_prompt(datetime.combine(today, datetime.min.time()))
+
 
-    logger = logging.getLogger(__name__)
+@lru_cache(maxsize=8)
+def _system_message(content: str) -> SystemMessage:
+    return SystemMessage(content=content)
 
+
+def _maybe_playlist_id(msg: ToolMessage) -> Optional[str]:
     try:
         # First try to parse as JSON (for create_playlist, get_playlist_tracks and other tools)
         data = json.loads(msg.content)
@@ -113,7 +112,8 @@ def _maybe_playlist_id(msg: ToolMessage) -> Optional[str]:
         ):
             logger.debug(f"🔍 Found playlist ID as string: {content}")
             return content
-        logger.debug(f"🔍 Content not recognized as playlist ID: {content[:50]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Content not recognized as playlist ID: {content[:50]}...")
         return None
     except Exception as e:
         logger.warning(f"⚠️ Error extracting playlist ID: {e}")
@@ -122,10 +122,6 @@ def _maybe_playlist_id(msg: ToolMessage) -> Optional[str]:
 
 def _maybe_playlist_data(msg: ToolMessage) -> Optional[dict]:
     """Extract playlist data from tool message if it's a valid playlist result"""
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
         data = json.loads(msg.content)
         # Check if this looks like playlist data (has tracks, name, etc.)
@@ -136,9 +132,10 @@ def _maybe_playlist_data(msg: ToolMessage) -> Optional[dict]:
             and "name" in data
             and "error" not in data
         ):
-            logger.debug(
-                f"🎵 Valid playlist data found: {data.get('name')} with {len(data.get('tracks', []))} tracks"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"🎵 Valid playlist data found: {data.get('name')} with {len(data.get('tracks', []))} tracks"
+                )
             return data
         elif isinstance(data, dict) and "error" in data:
             logger.warning(f"⚠️ Tool returned error: {data.get('error')}")
@@ -150,55 +147,29 @@ def _maybe_playlist_data(msg: ToolMessage) -> Optional[dict]:
 
 @traceable(name="spotify_dj_agent_call_model")
 async def call_model(state, config):
-    import logging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"🤖 call_model started with state keys: {list(state.keys())}")
 
-    logger = logging.getLogger(__name__)
-    logger.debug(f"🤖 call_model started with state keys: {list(state.keys())}")
-
-    # Add tracing metadata (if LangSmith is available)
-    if langsmith_client:
-        # Metadata for tracing context
-        pass
+    configurable = config.get("configurable", {})
 
-    # Add system prompt if first turn or use provided system prompt
+    # Add system prompt if first turn or use provided system prompt. The same
+    # SystemMessage object is reused for the whole day so the prompt prefix
+    # stays byte-identical and provider-side prefix caching keeps hitting.
     if not any(isinstance(m, SystemMessage) for m in state["messages"]):
-        system_content = config["configurable"].get(
-            "system",
-            build_system_prompt(),
+        system_content = configurable.get("system") or _default_system_prompt(
+            date.today()
         )
-        messages = [SystemMessage(content=system_content)] + state["messages"]
+        messages = [_system_message(system_content)] + state["messages"]
     else:
-        messages = list(state["messages"])
+        # Read-only from here on: compaction always builds new lists
+        messages = state["messages"]
 
-    logger.debug("🤖 Initializing ChatOpenAI model for OpenRouter")
     headers = {}
     if settings.openrouter_referer:
         headers["HTTP-Referer"] = settings.openrouter_referer
     if settings.openrouter_title:
         headers["X-Title"] = settings.openrouter_title
 
-    configurable = config.get("configurable", {})
-    # Always use standard openrouter_model for summarization (not ultrathink)
-    model_name = configurable.get(
-        "openrouter_model_override", settings.openrouter_model
-    )
-
-    logger.debug(f"🤖 Using OpenRouter model: {model_name}")
-
-    model_config = {
-        "api_key": settings.openrouter_api_key,
-        "base_url": settings.openrouter_base_url,
-        "model": model_name,
-        "default_headers": headers or None,
-    }
-
-    # Apply low reasoning effort specifically for openai/gpt-5
-    if model_name and model_name.lower().startswith("openai/gpt-5"):
-        logger.debug("🤖 Applying low reasoning effort for openai/gpt-5")
-        model_config["reasoning_effort"] = "low"
-
-    model = ChatOpenAI(**model_config)
-
     # Only run summarization at the start of a new user turn, not between tool calls
     # Check if the last message (before this turn) is from a tool - if so, skip summarization
     original_messages = state.get("messages", [])
@@ -214,8 +185,9 @@ async def call_model(state, config):
         else None
     )
 
+    summary_task = None
     if is_new_user_turn:
-        # Apply langmem summarization only at the start of new user turns
+        # Compact history only at the start of new user turns
         logger.debug("📝 New user turn detected, running summarization check")
 
         # Create summarization model using standard openrouter_model (not ultrathink)
@@ -224,18 +196,60 @@ async def call_model(state, config):
             "base_url": settings.openrouter_base_url,
             "model": settings.openrouter_model,  # Always use standard model for summarization
             "default_headers": headers or None,
+            "max_tokens": SUMMARIZATION_MAX_SUMMARY_TOKENS,
         }
         summarization_model = ChatOpenAI(**summarization_model_config)
 
-        summarization_result = summarize_messages(
-            messages,
-            running_summary=running_summary,
-            model=summarization_model,
-            max_tokens=SUMMARIZATION_MAX_TOKENS,
-            max_tokens_before_summary=SUMMARIZATION_TRIGGER_TOKENS,
-            max_summary_tokens=SUMMARIZATION_MAX_SUMMARY_TOKENS,
+        # Start summarization now so its network round trip overlaps with
+        # building the main model and binding the tool schemas below. The
+        # sleep(0) yields to the loop so the task runs up to its request
+        # before the synchronous setup that follows.
+        summary_task = asyncio.create_task(
+            acompress_history(
+                messages,
+                running_summary=running_summary,
+                model=summarization_model,
+                cache_reset_turns=configurable.get(
+                    "cache_reset_turns", CACHE_RESET_TURNS
+                ),
+            )
         )
+        await asyncio.sleep(0)
+
+    logger.debug("🤖 Initializing ChatOpenAI model for OpenRouter")
+    # Always use standard openrouter_model for summarization (not ultrathink)
+    model_name = configurable.get(
+        "openrouter_model_override", settings.openrouter_model
+    )
 
+    logger.debug(f"🤖 Using OpenRouter model: {model_name}")
+
+    model_config = {
+        "api_key": settings.openrouter_api_key,
+        "base_url": settings.openrouter_base_url,
+        "model": model_name,
+        "default_headers": headers or None,
+    }
+
+    # Apply low reasoning effort specifically for openai/gpt-5
+    if model_name and model_name.lower().startswith("openai/gpt-5"):
+        logger.debug("🤖 Applying low reasoning effort for openai/gpt-5")
+        model_config["reasoning_effort"] = "low"
+
+    try:
+        model = ChatOpenAI(**model_config)
+
+        logger.debug(f"🤖 Binding tools to model")
+        model_with_tools = model.bind_tools(get_tool_defs(config))
+    except Exception:
+        # Don't leave the summarization request running unobserved
+        if summary_task is not None:
+            summary_task.cancel()
+            await asyncio.gather(summary_task, return_exceptions=True)
+        raise
+
+    if summary_task is not None:
+        summarization_result = await summary_task
         messages_for_llm = summarization_result.messages
         logger.debug(
             f"📝 After summarization: {len(messages)} -> {len(messages_for_llm)} messages"
@@ -243,14 +257,9 @@ async def call_model(state, config):
     else:
         # Mid-flow (after tools), skip summarization to preserve tool context
         logger.debug("📝 Mid-flow detected (after tools), skipping summarization")
-        messages_for_llm = messages
-        # Create a minimal result object to avoid breaking the running_summary update logic
-        summarization_result = type(
-            "SummarizationResult", (), {"running_summary": running_summary}
-        )()
-
-    logger.debug(f"🤖 Binding tools to model")
-    model_with_tools = model.bind_tools(get_tool_defs(config))
+        messages_for_llm = apply_running_summary(messages, running_summary)
+        summarization_result = CompactionResult(messages, running_summary)
+
     logger.debug(f"🤖 Calling model with {len(messages_for_llm)} messages")
     response = await model_with_tools.ainvoke(messages_for_llm)
     logger.debug(f"🤖 Model response received: {type(response)}")
@@ -267,19 +276,17 @@ async def call_model(state, config):
 
 @traceable(name="spotify_dj_agent_run_tools")
 async def run_tools(input, config, **kwargs):
-    import logging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"🔧 run_tools called with input keys: {list(input.keys())}")
 
-    logger = logging.getLogger(__name__)
-    logger.debug(f"🔧 run_tools called with input keys: {list(input.keys())}")
-
-    # Initialize caches in config from state (tools read from these)
+    # Expose this thread's cache to the tools through the config. Tools write
+    # into the same dict, so nothing has to be copied back into the state.
     configurable = config.setdefault("configurable", {})
-    configurable.setdefault("search_cache", input.get("search_cache", {}))
-    configurable.setdefault("track_cache", input.get("track_cache", {}))
-    configurable.setdefault("artist_cache", input.get("artist_cache", {}))
+    caches = get_session_caches(configurable.get("thread_id"))
+    configurable.setdefault("search_cache", caches.search_cache)
 
     # Execute tools
-    tool_node = ToolNode(get_tools(config))
+    tool_node = get_tool_node(config)
     logger.debug("🔧 Executing tools")
     result = await tool_node.ainvoke(input, config, **kwargs)
     logger.debug("🔧 Tools execution completed")
@@ -306,11 +313,6 @@ async def run_tools(input, config, **kwargs):
             if playlist_data.get("name"):
                 updates["playlist_name"] = playlist_data["name"]
 
-    # Persist caches back to state
-    updates["search_cache"] = configurable.get("search_cache", {})
-    updates["track_cache"] = configurable.get("track_cache", {})
-    updates["artist_cache"] = configurable.get("artist_cache", {})
-
     result.update(updates)
     return result
 
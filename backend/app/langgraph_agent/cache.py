@@ -0,0 +1,95 @@
+"""
+Process-wide caches for Spotify tool results
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+from cachetools import TTLCache
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ToolResultCache:
+    """Bounded LRU + TTL cache shared across requests and conversations.
+
+    Entries live in an in-process TTLCache by default. With
+    TOOL_CACHE_BACKEND=redis they are stored in Redis with SETEX instead, so
+    several worker processes share them.
+    """
+
+    def __init__(self, namespace: str, maxsize: int, ttl: int):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        # Bumped by delete() so a write computed before an invalidation can be dropped
+        self._generations: Dict[Hashable, int] = {}
+        self._redis = None
+        if settings.tool_cache_backend == "redis":
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+
+    def _redis_key(self, key: Hashable) -> str:
+        return f"tool_cache:{self.namespace}:{json.dumps(key)}"
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        if self._redis is not None:
+            try:
+                value = await self._redis.get(self._redis_key(key))
+                return json.loads(value) if value is not None else None
+            except Exception as e:
+                logger.warning("Redis tool cache read failed, using local cache: %s", e)
+        with self._lock:
+            return self._local.get(key)
+
+    def generation(self, key: Hashable) -> int:
+        """Return how many times key has been deleted in this process."""
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    async def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """Store value under key for the cache's TTL.
+
+        If generation is given and key was deleted since it was read with
+        generation(), the value is stale and is not stored.
+        """
+        if generation is not None and self.generation(key) != generation:
+            return
+        if self._redis is not None:
+            try:
+                await self._redis.setex(
+                    self._redis_key(key), self.ttl, json.dumps(value)
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    "Redis tool cache write failed, using local cache: %s", e
+                )
+        with self._lock:
+            self._local[key] = value
+
+    async def delete(self, key: Hashable) -> None:
+        """Drop the entry for key, if any."""
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self._redis_key(key))
+            except Exception as e:
+                logger.warning("Redis tool cache delete failed: %s", e)
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._local.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries held in this process."""
+        with self._lock:
+            self._local.clear()
+            self._generations.clear()
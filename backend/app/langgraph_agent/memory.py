@@ -0,0 +1,220 @@
+"""Conversation history compaction for the Spotify agent.
+
+Instead of re-summarizing a growing window on every turn, the history is split
+into selection units (a message plus the tool results that answer it). The
+first and last few units stay verbatim and only the middle is folded into a
+running summary, which is reused until the active history crosses the trigger
+threshold again.
+
+Between compactions the history is append-only: the system prompt, the summary
+message and every kept message keep their position and content, so each call
+shares its prefix with the previous one.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AnyMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    get_buffer_string,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+import tiktoken
+from langmem.short_term import RunningSummary
+
+logger = logging.getLogger(__name__)
+
+# Summarization constants
+SUMMARIZATION_TRIGGER_TOKENS = 10000  # Token threshold to trigger summarization
+SUMMARIZATION_MAX_SUMMARY_TOKENS = 256  # Maximum tokens for the summary itself
+KEEP_FIRST_GROUPS = 1  # Leading selection units always kept verbatim
+KEEP_LAST_GROUPS = 5  # Trailing selection units always kept verbatim
+# Minimum user turns between compactions. Each compaction rewrites the prompt
+# prefix and invalidates provider-side prompt caching, so it has to pay off.
+CACHE_RESET_TURNS = 3
+
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a conversation between a user and "
+    "Mr. DJ, a Spotify playlist curator. Extend the existing summary with the "
+    "new messages below. Keep the user's musical preferences, the playlists "
+    "that were created (names and IDs) and any open requests. Be concise.\n\n"
+    "Existing summary:\n{summary}\n\nNew messages:\n{messages}"
+)
+
+
+@dataclass
+class CompactionResult:
+    """Messages to send to the model and the (possibly updated) running summary."""
+
+    messages: List[AnyMessage]
+    running_summary: Optional[RunningSummary]
+
+
+def _group_messages(messages: List[AnyMessage]) -> List[List[AnyMessage]]:
+    """Split messages into selection units.
+
+    Every ToolMessage is attached to the unit of the message before it, so an
+    AIMessage with tool calls is never separated from its tool results.
+    """
+    groups: List[List[AnyMessage]] = []
+    for message in messages:
+        if isinstance(message, ToolMessage) and groups:
+            groups[-1].append(message)
+        else:
+            groups.append([message])
+    return groups
+
+
+@lru_cache(maxsize=1)
+def _encoder() -> Optional[tiktoken.Encoding]:
+    """Load the tokenizer on first use, or None if it can't be loaded.
+
+    Without a cached BPE file tiktoken downloads it, so loading at import time
+    would make the app unable to start offline. Encoders are thread-safe and
+    expensive to construct, so the result is kept for the process.
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(
+            "⚠️ tiktoken encoder unavailable, estimating tokens instead: %s", e
+        )
+        return None
+
+
+def _count_tokens(messages: List[AnyMessage]) -> int:
+    """Count tokens in message contents, including structured content blocks."""
+    encoder = _encoder()
+    if encoder is None:
+        return count_tokens_approximately(messages)
+    total = 0
+    for message in messages:
+        content = message.content
+        if isinstance(content, str):
+            total += len(encoder.encode(content))
+            continue
+        for block in content:
+            if isinstance(block, str):
+                total += len(encoder.encode(block))
+            elif isinstance(block, dict) and isinstance(block.get("text"), str):
+                total += len(encoder.encode(block["text"]))
+    return total
+
+
+def _summary_message(running_summary: RunningSummary) -> SystemMessage:
+    return SystemMessage(
+        content=f"Summary of the conversation so far: {running_summary.summary}"
+    )
+
+
+def _split_history(
+    messages: List[AnyMessage], running_summary: Optional[RunningSummary]
+) -> tuple[List[AnyMessage], List[AnyMessage]]:
+    """Return (system messages, messages not yet folded into the summary)."""
+    summarized_ids = (
+        running_summary.summarized_message_ids if running_summary else set()
+    )
+    system_messages = [m for m in messages if isinstance(m, SystemMessage)]
+    active = [
+        m
+        for m in messages
+        if not isinstance(m, SystemMessage) and m.id not in summarized_ids
+    ]
+    return system_messages, active
+
+
+def _with_summary(
+    system_messages: List[AnyMessage],
+    groups: List[List[AnyMessage]],
+    running_summary: RunningSummary,
+) -> List[AnyMessage]:
+    """Lay out the history as system, head, summary, then the remaining groups.
+
+    The summary covers the turns between the kept head and the rest, so it goes
+    between them.
+    """
+    head = [m for group in groups[:KEEP_FIRST_GROUPS] for m in group]
+    rest = [m for group in groups[KEEP_FIRST_GROUPS:] for m in group]
+    return system_messages + head + [_summary_message(running_summary)] + rest
+
+
+def apply_running_summary(
+    messages: List[AnyMessage], running_summary: Optional[RunningSummary]
+) -> List[AnyMessage]:
+    """Replace already-summarized messages with the running summary, without an LLM call."""
+    if not running_summary:
+        return messages
+    system_messages, active = _split_history(messages, running_summary)
+    return _with_summary(system_messages, _group_messages(active), running_summary)
+
+
+async def acompress_history(
+    messages: List[AnyMessage],
+    *,
+    running_summary: Optional[RunningSummary],
+    model: BaseChatModel,
+    cache_reset_turns: int = CACHE_RESET_TURNS,
+) -> CompactionResult:
+    """Compact the conversation history once it grows past the trigger threshold.
+
+    Args:
+        messages: Full message history, optionally starting with system messages.
+        running_summary: Summary produced by a previous compaction, if any.
+        model: Chat model used to write the summary.
+        cache_reset_turns: Minimum user turns since the last compaction before
+            the prefix may be rewritten again.
+
+    Returns:
+        CompactionResult with the messages for the LLM and the running summary.
+    """
+    system_messages, active = _split_history(messages, running_summary)
+
+    groups = _group_messages(active)
+    keep = KEEP_FIRST_GROUPS + KEEP_LAST_GROUPS
+    # After a compaction the active history is head + kept tail + new groups
+    turns_since_reset = sum(
+        isinstance(m, HumanMessage) for group in groups[keep:] for m in group
+    )
+    if (
+        len(groups) <= keep
+        or (running_summary and turns_since_reset < cache_reset_turns)
+        or _count_tokens(active) < SUMMARIZATION_TRIGGER_TOKENS
+    ):
+        return CompactionResult(
+            apply_running_summary(messages, running_summary), running_summary
+        )
+
+    head = groups[:KEEP_FIRST_GROUPS]
+    middle = groups[KEEP_FIRST_GROUPS:-KEEP_LAST_GROUPS]
+    tail = groups[-KEEP_LAST_GROUPS:]
+    to_summarize = [m for group in middle for m in group]
+
+    logger.info("📝 Compacting %d messages into running summary", len(to_summarize))
+    response = await model.ainvoke(
+        [
+            HumanMessage(
+                content=SUMMARY_PROMPT.format(
+                    summary=running_summary.summary if running_summary else "(none)",
+                    messages=get_buffer_string(to_summarize),
+                )
+            )
+        ]
+    )
+
+    new_summary = RunningSummary(
+        summary=response.content,
+        summarized_message_ids=(
+            set(running_summary.summarized_message_ids) if running_summary else set()
+        )
+        | {m.id for m in to_summarize if m.id},
+        last_summarized_message_id=to_summarize[-1].id,
+    )
+    return CompactionResult(
+        _with_summary(system_messages, head + tail, new_summary), new_summary
+    )
@@ -52,6 +52,7 @@ def build_system_prompt(today: Optional[datetime] = None) -> str:
 
 <tools_overview>
 - `search_tracks`: Find songs by name, artist, or descriptive keywords.
+- `search_tracks_batch`: Run many track searches in one call (preferred when looking up several songs).
 - `search_artists`: Find artists by name.
 - `get_artist_top_tracks`: Get an artist's popular tracks.
 - `get_track_recommendations`: Primary tool for mood/vibe/genre requests.
@@ -80,6 +81,7 @@ def build_system_prompt(today: Optional[datetime] = None) -> str:
 <tool_selection_strategy>
 - Specific artists or songs (e.g., "Beatles", "Bohemian Rhapsody"):
   - Use `search_tracks` and/or `search_artists`.
+  - When looking up several specific songs, pass them all to one `search_tracks_batch` call instead of calling `search_tracks` repeatedly.
 - External music context (charts, TV/film/commercial soundtracks, viral songs):
   - Use `tavily_search` first, then Spotify tools to locate the tracks.
 - Well-known eras or classic artists (e.g., "70s rock hits"):
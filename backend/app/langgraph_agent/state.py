@@ -1,5 +1,7 @@
-from typing import Annotated, Optional, Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Annotated, Optional, Dict, Any, MutableMapping, Tuple
 from typing_extensions import TypedDict
+from cachetools import LRUCache, TTLCache
 from langgraph.graph.message import add_messages
 
 
@@ -9,10 +11,43 @@ class AgentState(TypedDict):
     playlist_id: Optional[str]
     playlist_name: Optional[str]
     playlist_data: Optional[Dict[str, Any]]
-    # Caching fields to prevent redundant API calls
-    search_cache: Optional[Dict[str, str]]  # Tavily results: query → results string
-    track_cache: Optional[Dict[str, List[Dict[str, Any]]]]  # Track searches: query → tracks
-    artist_cache: Optional[Dict[str, List[Dict[str, Any]]]]  # Artist searches: query → artists
-    recommendations_cache: Optional[List[Dict[str, Any]]]  # Last recommendations
     # Context for langmem summarization (stores RunningSummary)
-    context: Optional[Dict[str, Any]]
\ No newline at end of file
+    context: Optional[Dict[str, Any]]
+
+
+# Tavily results kept per conversation before the least recently used are dropped
+SEARCH_CACHE_MAXSIZE = 256
+
+
+@dataclass
+class SessionCaches:
+    """Per-thread caches that prevent redundant API calls.
+
+    Kept outside AgentState so the checkpointer does not copy them on every
+    node transition. Spotify search results are cached process-wide in
+    tools.py instead.
+    """
+
+    search_cache: MutableMapping[Tuple[str, int], str] = field(
+        default_factory=lambda: LRUCache(maxsize=SEARCH_CACHE_MAXSIZE)
+    )  # Tavily: (query, max_results) → results, oldest evicted first
+
+
+# thread_id → caches for that conversation. Bounded in size, and conversations
+# idle for longer than the TTL expire on later cache access, so abandoned
+# threads are reclaimed without a background sweeper task.
+SESSION_CACHES_MAXSIZE = 10_000
+SESSION_CACHES_TTL = 6 * 3600
+_session_caches: TTLCache = TTLCache(
+    maxsize=SESSION_CACHES_MAXSIZE, ttl=SESSION_CACHES_TTL
+)
+
+
+def get_session_caches(thread_id: Optional[str]) -> SessionCaches:
+    """Return the caches for a conversation thread, creating them on first use."""
+    caches = _session_caches.get(thread_id)
+    if caches is None:
+        caches = SessionCaches()
+    # Re-inserting refreshes the TTL, so only idle conversations expire
+    _session_caches[thread_id] = caches
+    return caches
@@ -1,52 +1,217 @@
+import asyncio
 import logging
+import operator
+import re
+import threading
+import httpx
 import spotipy
-import os
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from cachetools import TTLCache
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from langchain_core.tools import tool
 from langchain_core.runnables import RunnableConfig
 from langchain_tavily import TavilySearch
 
-from .models import Track
+from .cache import ToolResultCache
+from .tracing import traceable
+from ..services.spotify_api import spotify_request
 
-# Import LangSmith tracing if available
-try:
-    from langsmith import traceable
+logger = logging.getLogger(__name__)
 
-    tracing_enabled = os.getenv(
-        "LANGSMITH_TRACING_ENABLED", "true"
-    ).lower() == "true" and os.getenv("LANGSMITH_API_KEY")
-    if tracing_enabled:
-        print("✅ LangSmith tracing enabled for Spotify tools")
-    else:
-        print("ℹ️  LangSmith tracing disabled for Spotify tools")
-except ImportError:
-    print("⚠️  LangSmith not available for tools tracing")
-    traceable = lambda name: lambda func: func  # No-op decorator
-    tracing_enabled = False
+# Search results shared across requests, bounded and expiring after an hour
+_track_cache = ToolResultCache("tracks", maxsize=10_000, ttl=3600)
+_artist_cache = ToolResultCache("artists", maxsize=5_000, ttl=3600)
+_top_tracks_cache = ToolResultCache("artist_top_tracks", maxsize=1_024, ttl=3600)
 
-logger = logging.getLogger(__name__)
+# Playlists served by GET /api/playlist, so remounts and polling don't refetch
+# from Spotify. The tools that edit a playlist drop its entry.
+playlist_cache = ToolResultCache("playlist", maxsize=256, ttl=30)
+
+# Rarely-changing data: the genre seed list is static for the process lifetime,
+# user info is kept per Spotify user (or access token) for half an hour.
+# get_user_info is sync and runs on ToolNode worker threads, hence the lock.
+_available_genres: Optional[List[str]] = None
+_user_info_cache: TTLCache = TTLCache(maxsize=64, ttl=1800)
+_user_info_lock = threading.Lock()
+
+# Full track details (album cover, preview URL, ...) by URI for every track the
+# tools have returned, so a freshly created playlist can be described without
+# reading it back from Spotify
+_track_details: TTLCache = TTLCache(maxsize=20_000, ttl=3600)
+
+
+def clear_user_info_cache() -> None:
+    """Forget cached user info, e.g. after the service account re-authenticates."""
+    with _user_info_lock:
+        _user_info_cache.clear()
+
+
+# Name of a Spotify artist object, used to join track credits
+_name_of = operator.itemgetter("name")
 
 
-def _track_to_dict(track: Track) -> Dict[str, Any]:
-    """Convert a Track object to a dictionary.
+def _spotify_item_to_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Spotify track object to the dictionary returned by the tools.
 
     Args:
-        track: The Track object.
+        item: Track object from the Spotify Web API.
 
     Returns:
-        A dictionary representation of the Track.
+        A dictionary with id, name, artist, album, uri, popularity and duration_ms.
     """
     return {
-        "id": track.id,
-        "name": track.name,
-        "artist": track.artist,
-        "album": track.album,
-        "uri": track.uri,
-        "popularity": track.popularity,
-        "duration_ms": track.duration_ms,
+        "id": item["id"],
+        "name": item["name"],
+        "artist": ", ".join(map(_name_of, item["artists"])),
+        "album": item["album"]["name"],
+        "uri": item["uri"],
+        "popularity": item.get("popularity", 0),
+        "duration_ms": item["duration_ms"],
     }
 
 
+# Required fields of a Spotify track object, fetched in one C-level call
+_RICH_TRACK_FIELDS = operator.itemgetter("id", "name", "uri", "duration_ms")
+
+# Shared read-only stand-in for tracks without album data
+_NO_ALBUM: Dict[str, Any] = {}
+
+
+def _item_to_rich_track_dict(track: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Spotify track object to the playlist track dictionary used by the UI."""
+    track_id, name, uri, duration_ms = _RICH_TRACK_FIELDS(track)
+    album = track.get("album") or _NO_ALBUM
+    album_images = album.get("images")
+    return {
+        "id": track_id,
+        "name": name,
+        "artist": ", ".join(map(_name_of, track.get("artists", ()))),
+        "album": album.get("name", ""),
+        "uri": uri,
+        "duration_ms": duration_ms,
+        "popularity": track.get("popularity", 0),
+        "album_cover": album_images[0]["url"] if album_images else None,
+        "preview_url": track.get("preview_url"),
+        "external_urls": track.get("external_urls", {}),
+    }
+
+
+def _remember_tracks(items: List[Dict[str, Any]]) -> None:
+    """Record full details for Spotify track objects, keyed by URI."""
+    for item in items:
+        if item:
+            _track_details[item["uri"]] = _item_to_rich_track_dict(item)
+
+
+def _spotify_available(config: RunnableConfig) -> bool:
+    """Whether the config carries an access token or a spotipy client."""
+    configurable = config.get("configurable", {}) if config else {}
+    return bool(configurable.get("spotify_token") or configurable.get("spotify_client"))
+
+
+def _token_refresher(
+    configurable: Dict[str, Any],
+) -> Optional[Callable[[], Awaitable[str]]]:
+    """Wrap the configured token provider so later calls in the run reuse the fresh token."""
+    provider = configurable.get("spotify_token_provider")
+    if provider is None:
+        return None
+
+    async def refresh() -> str:
+        token = configurable["spotify_token"] = await provider()
+        return token
+
+    return refresh
+
+
+async def _spotify_request(
+    config: RunnableConfig,
+    path: str,
+    params: Dict[str, Any],
+    fallback: Callable[[spotipy.Spotify], Dict[str, Any]],
+    method: str = "GET",
+    json: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Call the Spotify Web API for a tool.
+
+    Uses the shared async HTTP client when an access token is configured and
+    falls back to the spotipy client, on a worker thread, otherwise.
+
+    Args:
+        config: Configuration containing spotify_token and/or spotify_client,
+            and optionally spotify_token_provider to refresh an expired token.
+        path: API path relative to https://api.spotify.com/v1.
+        params: Query parameters for the async request.
+        fallback: Equivalent spotipy call, used when no token is available.
+        method: HTTP method for the async request. Default is 'GET'.
+        json: JSON body for the async request.
+
+    Returns:
+        The decoded JSON response, or None if no Spotify credentials are configured.
+    """
+    configurable = config.get("configurable", {}) if config else {}
+    token = configurable.get("spotify_token")
+    if token:
+        return await spotify_request(
+            token,
+            method,
+            path,
+            params=params,
+            json=json,
+            refresh_token=_token_refresher(configurable),
+        )
+
+    spotify_client = configurable.get("spotify_client")
+    if not spotify_client:
+        return None
+    # spotipy is blocking; keep it off the event loop
+    return await asyncio.to_thread(fallback, spotify_client)
+
+
+async def _current_user_id(config: RunnableConfig) -> str:
+    """Return the Spotify user ID, calling /me only if the config doesn't know it yet."""
+    configurable = config["configurable"]
+    user_id = configurable.get("user_id")
+    if not user_id:
+        me = await _spotify_request(
+            config, "/me", {}, lambda client: client.current_user()
+        )
+        user_id = configurable["user_id"] = me["id"]
+    return user_id
+
+
+async def _create_user_playlist(
+    config: RunnableConfig, name: str, public: bool, description: str
+) -> Dict[str, Any]:
+    """Create an empty playlist for the current user and return Spotify's playlist object."""
+    user_id = await _current_user_id(config)
+    return await _spotify_request(
+        config,
+        f"/users/{user_id}/playlists",
+        {},
+        lambda client: client.user_playlist_create(
+            user=user_id, name=name, public=public, description=description
+        ),
+        method="POST",
+        json={"name": name, "public": public, "description": description},
+    )
+
+
+# Matches a full track URI, an open.spotify.com track URL or a bare track ID
+# (alphanumeric, typically 22 chars), capturing the ID
+_TRACK_URI_RE = re.compile(
+    r"(?:spotify:track:|(?:https?://)?open\.spotify\.com/(?:intl-[\w-]+/)?track/)"
+    r"([A-Za-z0-9_-]+)(?:[?#].*)?"
+    r"|([A-Za-z0-9_-]{15,30})"
+)
+
+
 def _normalize_track_uris(track_uris: List[str]) -> List[str]:
     """Normalize track URIs to ensure they have the correct format.
 
@@ -59,39 +224,84 @@ def _normalize_track_uris(track_uris: List[str]) -> List[str]:
     Returns:
         List of normalized track URIs in the format 'spotify:track:TRACK_ID'.
     """
-    normalized = []
-    for uri in track_uris:
-        if not uri:
-            continue
-
-        uri = uri.strip()
-
-        # Already a valid Spotify track URI
-        if uri.startswith("spotify:track:"):
-            normalized.append(uri)
-        # Spotify URL format (https://open.spotify.com/track/TRACK_ID)
-        elif "open.spotify.com/track/" in uri:
-            try:
-                track_id = uri.split("/track/")[1].split("?")[0]
-                if track_id:
-                    normalized.append(f"spotify:track:{track_id}")
-            except (IndexError, AttributeError):
-                logger.warning(f"Could not extract track ID from URL: {uri}")
-        # Just a track ID (alphanumeric, typically 22 chars)
-        elif uri.replace("_", "").replace("-", "").isalnum() and 15 <= len(uri) <= 30:
-            normalized.append(f"spotify:track:{uri}")
-        else:
-            logger.warning(f"Unrecognized track URI format, skipping: {uri}")
-
+    match = _TRACK_URI_RE.fullmatch
+    normalized = [
+        f"spotify:track:{m.group(1) or m.group(2)}"
+        for uri in track_uris
+        if uri and (m := match(uri.strip()))
+    ]
+    if len(normalized) < len(track_uris):
+        logger.warning(
+            "Skipped %d unrecognized track URIs", len(track_uris) - len(normalized)
+        )
     return normalized
 
 
+def _unique_track_uris(track_uris: List[str]) -> List[str]:
+    """Normalize track URIs and drop duplicates, keeping first-seen order.
+
+    Agents often merge overlapping search results; duplicates would cost extra
+    API calls and show up twice in the playlist.
+    """
+    valid_uris = _normalize_track_uris(track_uris)
+    unique_uris = list(dict.fromkeys(valid_uris))
+    if len(unique_uris) < len(valid_uris):
+        logger.info(
+            "Dropped %d duplicate track URIs", len(valid_uris) - len(unique_uris)
+        )
+    return unique_uris
+
+
+async def _search_tracks(
+    query: str, config: RunnableConfig, limit: int, market: str
+) -> List[Dict[str, Any]]:
+    """Run one track search, consulting and filling the track cache."""
+    # Nothing to search for; skip the round trip (and keep it out of the cache)
+    if not query.strip() or limit <= 0:
+        return []
+
+    # Check cache first
+    cache_key = (query.lower().strip(), limit, market)
+    cached = await _track_cache.get(cache_key)
+    if cached is not None:
+        logger.info("🎯 Cache HIT for track search: %r", query)
+        return cached
+
+    logger.info("🔍 Cache MISS for track search: %r - performing search", query)
+    try:
+        results = await _spotify_request(
+            config,
+            "/search",
+            {"q": query, "type": "track", "limit": limit, "market": market},
+            lambda client: client.search(
+                q=query, type="track", limit=limit, market=market
+            ),
+        )
+        if results is None:
+            logger.error("Spotify client not found in config")
+            return []
+
+        items = results["tracks"]["items"]
+        _remember_tracks(items)
+        track_dicts = [_spotify_item_to_dict(item) for item in items]
+
+        # Write result to cache
+        if track_dicts:
+            await _track_cache.set(cache_key, track_dicts)
+            logger.info("💾 Cached %d tracks for query %r", len(track_dicts), query)
+
+        return track_dicts
+    except Exception as e:
+        logger.error("Error searching tracks for query %r: %s", query, e)
+        return []
+
+
 @tool(
     description="Find tracks on Spotify by searching for song names, artists, or keywords",
     parse_docstring=True,
 )
 @traceable(name="spotify_search_tracks")
-def search_tracks(
+async def search_tracks(
     query: str,
     config: RunnableConfig,
     limit: int = 20,
@@ -108,46 +318,50 @@ def search_tracks(
     Returns:
         A list of dictionaries, each containing: id, name, artist, album, uri, popularity, and duration_ms.
     """
-    logger.info(f"Searching tracks: query='{query}', limit={limit}, market={market}")
+    logger.info("Searching tracks: query=%r, limit=%d, market=%s", query, limit, market)
+    return await _search_tracks(query, config, limit, market)
 
-    # Check cache first
-    cache_key = f"{query}_{limit}_{market}"
-    track_cache = config.get("configurable", {}).get("track_cache", {})
-    if cache_key in track_cache:
-        logger.info(f"🎯 Cache HIT for track search: '{query}'")
-        return track_cache[cache_key]
 
-    logger.info(f"🔍 Cache MISS for track search: '{query}' - performing search")
-    try:
-        spotify_client = config["configurable"].get("spotify_client")
-        if not spotify_client:
-            logger.error("Spotify client not found in config")
-            return []
-
-        results = spotify_client.search(
-            q=query, type="track", limit=limit, market=market
-        )
-        tracks = [Track.from_spotify_track(item) for item in results["tracks"]["items"]]
-        track_dicts = [_track_to_dict(track) for track in tracks]
+@tool(
+    description="Run several Spotify track searches at once. Prefer this over repeated search_tracks calls when looking up multiple songs or keywords",
+    parse_docstring=True,
+)
+@traceable(name="spotify_search_tracks_batch")
+async def search_tracks_batch(
+    queries: List[str],
+    config: RunnableConfig,
+    limit: int = 20,
+    market: str = "US",
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Search Spotify for several queries concurrently.
 
-        # Write result to cache
-        if track_dicts:
-            config.setdefault("configurable", {}).setdefault("track_cache", {})[
-                cache_key
-            ] = track_dicts
-            logger.info(f"💾 Cached {len(track_dicts)} tracks for query '{query}'")
+    Args:
+        queries: Search queries (song names, artists, or keywords).
+        config: Configuration containing spotify_client in a 'configurable' dict.
+        limit: Maximum number of tracks to return per query. Default is 20.
+        market: Country code for market-specific results. Default is 'US'.
 
-        return track_dicts
-    except Exception as e:
-        logger.error(f"Error searching tracks for query '{query}': {e}")
-        return []
+    Returns:
+        A dictionary mapping each query to its list of tracks (id, name, artist, album, uri, popularity, duration_ms).
+    """
+    unique_queries = list(dict.fromkeys(queries))
+    logger.info(
+        "Searching tracks in batch: %d queries, limit=%d, market=%s",
+        len(unique_queries),
+        limit,
+        market,
+    )
+    results = await asyncio.gather(
+        *(_search_tracks(query, config, limit, market) for query in unique_queries)
+    )
+    return dict(zip(unique_queries, results))
 
 
 @tool(
     description="Find artists on Spotify by searching for artist names or related terms",
     parse_docstring=True,
 )
-def search_artists(
+async def search_artists(
     query: str,
     config: RunnableConfig,
     limit: int = 10,
@@ -162,23 +376,29 @@ def search_artists(
     Returns:
         A list of dictionaries, each containing: id, name, genres, and popularity.
     """
-    logger.info(f"Searching artists: query='{query}', limit={limit}")
+    logger.info("Searching artists: query=%r, limit=%d", query, limit)
+    if not query.strip() or limit <= 0:
+        return []
 
     # Check cache first
-    cache_key = f"{query}_{limit}"
-    artist_cache = config.get("configurable", {}).get("artist_cache", {})
-    if cache_key in artist_cache:
-        logger.info(f"🎯 Cache HIT for artist search: '{query}'")
-        return artist_cache[cache_key]
+    cache_key = (query.lower().strip(), limit)
+    cached = await _artist_cache.get(cache_key)
+    if cached is not None:
+        logger.info("🎯 Cache HIT for artist search: %r", query)
+        return cached
 
-    logger.info(f"🔍 Cache MISS for artist search: '{query}' - performing search")
+    logger.info("🔍 Cache MISS for artist search: %r - performing search", query)
     try:
-        spotify_client = config["configurable"].get("spotify_client")
-        if not spotify_client:
+        results = await _spotify_request(
+            config,
+            "/search",
+            {"q": query, "type": "artist", "limit": limit},
+            lambda client: client.search(q=query, type="artist", limit=limit),
+        )
+        if results is None:
             logger.error("Spotify client not found in config")
             return []
 
-        results = spotify_client.search(q=query, type="artist", limit=limit)
         artists = [
             {
                 "id": item["id"],
@@ -191,14 +411,12 @@ def search_artists(
 
         # Write result to cache
         if artists:
-            config.setdefault("configurable", {}).setdefault("artist_cache", {})[
-                cache_key
-            ] = artists
-            logger.info(f"💾 Cached {len(artists)} artists for query '{query}'")
+            await _artist_cache.set(cache_key, artists)
+            logger.info("💾 Cached %d artists for query %r", len(artists), query)
 
         return artists
     except Exception as e:
-        logger.error(f"Error searching artists for query '{query}': {e}")
+        logger.error("Error searching artists for query %r: %s", query, e)
         return []
 
 
@@ -206,7 +424,7 @@ def search_artists(
     description="Retrieve the most popular tracks for a specific artist",
     parse_docstring=True,
 )
-def get_artist_top_tracks(
+async def get_artist_top_tracks(
     artist_id: str,
     config: RunnableConfig,
     country: str = "US",
@@ -222,29 +440,72 @@ def get_artist_top_tracks(
         A list of dictionaries, each containing: id, name, artist, album, uri, popularity, duration_ms.
     """
     logger.info(
-        f"Getting top tracks for artist: artist_id={artist_id}, country={country}"
+        "Getting top tracks for artist: artist_id=%s, country=%s", artist_id, country
     )
+    if not artist_id.strip():
+        return []
+
+    # Check cache first
+    cache_key = (artist_id.strip(), country)
+    cached = await _top_tracks_cache.get(cache_key)
+    if cached is not None:
+        logger.info("🎯 Cache HIT for artist top tracks: %s", artist_id)
+        return cached
+
     try:
-        spotify_client = config["configurable"].get("spotify_client")
-        if not spotify_client:
+        results = await _spotify_request(
+            config,
+            f"/artists/{artist_id}/top-tracks",
+            {"market": country},
+            lambda client: client.artist_top_tracks(artist_id, country=country),
+        )
+        if results is None:
             logger.error("Spotify client not found in config")
             return []
 
-        results = spotify_client.artist_top_tracks(artist_id, country=country)
-        tracks = [Track.from_spotify_track(item) for item in results["tracks"]]
-        track_dicts = [_track_to_dict(track) for track in tracks]
-        logger.info(f"Found {len(track_dicts)} top tracks for artist {artist_id}")
+        _remember_tracks(results["tracks"])
+        track_dicts = [_spotify_item_to_dict(item) for item in results["tracks"]]
+        logger.info("Found %d top tracks for artist %s", len(track_dicts), artist_id)
+        if track_dicts:
+            await _top_tracks_cache.set(cache_key, track_dicts)
         return track_dicts
     except Exception as e:
-        logger.error(f"Error getting top tracks for artist {artist_id}: {e}")
+        logger.error("Error getting top tracks for artist %s: %s", artist_id, e)
         return []
 
 
+# Tunable attributes accepted by the recommendations endpoint
+_AUDIO_FEATURE_NAMES = frozenset(
+    {
+        "acousticness",
+        "danceability",
+        "duration_ms",
+        "energy",
+        "instrumentalness",
+        "key",
+        "liveness",
+        "loudness",
+        "mode",
+        "popularity",
+        "speechiness",
+        "tempo",
+        "time_signature",
+        "valence",
+    }
+)
+# Every tunable keyword the endpoint understands, resolved once at import
+_AUDIO_FEATURE_PARAMS = frozenset(
+    f"{prefix}{name}"
+    for prefix in ("min_", "max_", "target_")
+    for name in _AUDIO_FEATURE_NAMES
+)
+
+
 @tool(
     description="Generate personalized track recommendations using seed tracks, artists, or genres with fine-tuned audio features",
     parse_docstring=True,
 )
-def get_track_recommendations(
+async def get_track_recommendations(
     config: RunnableConfig,
     seed_tracks: Optional[List[str]] = None,
     seed_artists: Optional[List[str]] = None,
@@ -314,111 +575,40 @@ def get_track_recommendations(
         f"Getting recommendations: seed_tracks={seed_tracks}, seed_artists={seed_artists}, seed_genres={seed_genres}, limit={limit}"
     )
     try:
-        # Build kwargs for non-None audio features
-        audio_features = {}
-
-        # Acousticness
-        if min_acousticness is not None:
-            audio_features["min_acousticness"] = min_acousticness
-        if max_acousticness is not None:
-            audio_features["max_acousticness"] = max_acousticness
-
-        # Danceability
-        if min_danceability is not None:
-            audio_features["min_danceability"] = min_danceability
-        if max_danceability is not None:
-            audio_features["max_danceability"] = max_danceability
-
-        # Duration
-        if min_duration_ms is not None:
-            audio_features["min_duration_ms"] = min_duration_ms
-        if max_duration_ms is not None:
-            audio_features["max_duration_ms"] = max_duration_ms
-
-        # Energy
-        if min_energy is not None:
-            audio_features["min_energy"] = min_energy
-        if max_energy is not None:
-            audio_features["max_energy"] = max_energy
-
-        # Instrumentalness
-        if min_instrumentalness is not None:
-            audio_features["min_instrumentalness"] = min_instrumentalness
-        if max_instrumentalness is not None:
-            audio_features["max_instrumentalness"] = max_instrumentalness
-
-        # Key
-        if min_key is not None:
-            audio_features["min_key"] = min_key
-        if max_key is not None:
-            audio_features["max_key"] = max_key
-        if target_key is not None:
-            audio_features["target_key"] = target_key
-
-        # Liveness
-        if min_liveness is not None:
-            audio_features["min_liveness"] = min_liveness
-        if max_liveness is not None:
-            audio_features["max_liveness"] = max_liveness
-
-        # Loudness
-        if min_loudness is not None:
-            audio_features["min_loudness"] = min_loudness
-        if max_loudness is not None:
-            audio_features["max_loudness"] = max_loudness
-
-        # Mode
-        if min_mode is not None:
-            audio_features["min_mode"] = min_mode
-        if max_mode is not None:
-            audio_features["max_mode"] = max_mode
-
-        # Popularity
-        if min_popularity is not None:
-            audio_features["min_popularity"] = min_popularity
-        if max_popularity is not None:
-            audio_features["max_popularity"] = max_popularity
-        if target_popularity is not None:
-            audio_features["target_popularity"] = target_popularity
-
-        # Speechiness
-        if min_speechiness is not None:
-            audio_features["min_speechiness"] = min_speechiness
-        if max_speechiness is not None:
-            audio_features["max_speechiness"] = max_speechiness
-
-        # Tempo
-        if min_tempo is not None:
-            audio_features["min_tempo"] = min_tempo
-        if max_tempo is not None:
-            audio_features["max_tempo"] = max_tempo
-
-        # Time Signature
-        if min_time_signature is not None:
-            audio_features["min_time_signature"] = min_time_signature
-        if max_time_signature is not None:
-            audio_features["max_time_signature"] = max_time_signature
-
-        # Valence
-        if min_valence is not None:
-            audio_features["min_valence"] = min_valence
-        if max_valence is not None:
-            audio_features["max_valence"] = max_valence
-
-        spotify_client = config["configurable"].get("spotify_client")
-        if not spotify_client:
+        # Build kwargs for non-None audio features from the tunable parameters
+        audio_features = {
+            name: value
+            for name, value in locals().items()
+            if value is not None and name in _AUDIO_FEATURE_PARAMS
+        }
+
+        seeds = {
+            name: ",".join(values)
+            for name, values in (
+                ("seed_tracks", seed_tracks),
+                ("seed_artists", seed_artists),
+                ("seed_genres", seed_genres),
+            )
+            if values
+        }
+        results = await _spotify_request(
+            config,
+            "/recommendations",
+            {**seeds, "limit": limit, **audio_features},
+            lambda client: client.recommendations(
+                seed_tracks=seed_tracks,
+                seed_artists=seed_artists,
+                seed_genres=seed_genres,
+                limit=limit,
+                **audio_features,
+            ),
+        )
+        if results is None:
             logger.error("Spotify client not found in config")
             return []
 
-        results = spotify_client.recommendations(
-            seed_tracks=seed_tracks,
-            seed_artists=seed_artists,
-            seed_genres=seed_genres,
-            limit=limit,
-            **audio_features,
-        )
-        tracks = [Track.from_spotify_track(item) for item in results["tracks"]]
-        track_dicts = [_track_to_dict(track) for track in tracks]
+        _remember_tracks(results["tracks"])
+        track_dicts = [_spotify_item_to_dict(item) for item in results["tracks"]]
         logger.info(f"Found {len(track_dicts)} recommendations")
         return track_dicts
     except Exception as e:
@@ -430,7 +620,7 @@ def get_track_recommendations(
     description="Retrieve all available music genres that can be used as recommendation seeds",
     parse_docstring=True,
 )
-def get_available_genres(
+async def get_available_genres(
     config: RunnableConfig,
 ) -> List[str]:
     """Get list of available genres for recommendations.
@@ -443,16 +633,25 @@ def get_available_genres(
     """
     logger.info("Getting available genres")
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        if not _spotify_available(config):
             logger.error("Spotify client not found in config")
             return []
 
-        genres = spotify_client.recommendation_genre_seeds()
+        global _available_genres
+        if _available_genres is not None:
+            logger.info("🎯 Cache HIT for available genres")
+            return _available_genres
+
+        genres = await _spotify_request(
+            config,
+            "/recommendations/available-genre-seeds",
+            {},
+            lambda client: client.recommendation_genre_seeds(),
+        )
         genre_list = genres["genres"]
         logger.info(f"Found {len(genre_list)} available genres")
+        if genre_list:
+            _available_genres = genre_list
         return genre_list
     except Exception as e:
         logger.error(f"Error getting available genres: {e}")
@@ -481,6 +680,16 @@ def get_user_info(config: RunnableConfig) -> Optional[Dict[str, Any]]:
             logger.error("Spotify client not found in config")
             return None
 
+        # Identify the account by user ID or token rather than the client
+        # object, whose id() can be reused once it is garbage-collected
+        configurable = config["configurable"]
+        cache_key = configurable.get("user_id") or configurable.get("spotify_token")
+        with _user_info_lock:
+            cached = _user_info_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.info(f"🎯 Cache HIT for user info: {cached['id']}")
+            return cached
+
         user_info = spotify_client.current_user()
         user_data = {
             "id": user_info.get("id"),
@@ -491,6 +700,9 @@ def get_user_info(config: RunnableConfig) -> Optional[Dict[str, Any]]:
         logger.info(
             f"Retrieved user info for: {user_data['display_name']} ({user_data['id']})"
         )
+        if cache_key:
+            with _user_info_lock:
+                _user_info_cache[cache_key] = user_data
         return user_data
     except Exception as e:
         logger.error(f"Error getting user info: {e}")
@@ -502,7 +714,7 @@ def get_user_info(config: RunnableConfig) -> Optional[Dict[str, Any]]:
     parse_docstring=True,
 )
 @traceable(name="spotify_create_playlist")
-def create_playlist(
+async def create_playlist(
     config: RunnableConfig,
     name: str,
     public: bool = True,
@@ -521,19 +733,11 @@ def create_playlist(
     """
     logger.info(f"Creating playlist: name='{name}', public={public}")
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        if not _spotify_available(config):
             logger.error("Spotify client not found in config")
             return None
 
-        user_info = spotify_client.current_user()
-        user_id = user_info["id"]
-
-        playlist = spotify_client.user_playlist_create(
-            user=user_id, name=name, public=public, description=description
-        )
+        playlist = await _create_user_playlist(config, name, public, description)
 
         playlist_data = {
             "id": playlist["id"],
@@ -555,12 +759,92 @@ def create_playlist(
         return None
 
 
+# Subset of a playlist tracks page used to build the track dicts
+_PLAYLIST_ITEM_FIELDS = (
+    "items(track(id,name,uri,duration_ms,popularity,preview_url,external_urls,"
+    "album(name,images),artists(name)))"
+)
+
+# Playlist metadata used to build playlist_data, without any tracks page
+_PLAYLIST_META_FIELDS = (
+    "id,name,description,public,collaborative,owner(display_name),images,"
+    "external_urls"
+)
+_PLAYLIST_INFO_FIELDS = f"{_PLAYLIST_META_FIELDS},tracks(total)"
+
+# The playlist object including its first page of tracks
+_PLAYLIST_FIELDS = f"{_PLAYLIST_META_FIELDS},tracks(total,{_PLAYLIST_ITEM_FIELDS})"
+
+# Maximum number of items Spotify returns per playlist tracks page, and how
+# many page requests may be in flight at once
+_PLAYLIST_PAGE_SIZE = 100
+_PLAYLIST_PAGE_CONCURRENCY = 4
+
+# Maximum number of IDs accepted by the several-tracks endpoint
+_TRACKS_BATCH_SIZE = 50
+
+# Maximum track URIs Spotify accepts per add-items request
+_SPOTIFY_PLAYLIST_ADD_MAX = 100
+
+
+# Appending is not idempotent: a request that reached Spotify but lost its
+# response would add the chunk twice on retry. Only retry failures from before
+# the request was sent. 429s are retried by spotify_request itself, and the
+# spotipy fallback has its own retry policy.
+_CONNECT_PHASE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception_type(_CONNECT_PHASE_ERRORS),
+    reraise=True,
+)
+async def _add_track_chunk(
+    config: RunnableConfig, playlist_id: str, chunk: List[str]
+) -> None:
+    """Append one chunk (at most 100) of track URIs to a playlist, retrying connection failures."""
+    await _spotify_request(
+        config,
+        f"/playlists/{playlist_id}/tracks",
+        {},
+        lambda client: client.playlist_add_items(playlist_id, chunk),
+        method="POST",
+        json={"uris": chunk},
+    )
+
+
+async def _fetch_playlist_pages(
+    config: RunnableConfig, playlist_id: str, start: int, end: int
+) -> List[Dict[str, Any]]:
+    """Fetch the playlist tracks pages covering offsets [start, end) concurrently."""
+    semaphore = asyncio.Semaphore(_PLAYLIST_PAGE_CONCURRENCY)
+
+    async def fetch_page(offset: int) -> Dict[str, Any]:
+        params = {
+            "fields": _PLAYLIST_ITEM_FIELDS,
+            "limit": min(_PLAYLIST_PAGE_SIZE, end - offset),
+            "offset": offset,
+        }
+        async with semaphore:
+            return await _spotify_request(
+                config,
+                f"/playlists/{playlist_id}/tracks",
+                params,
+                lambda client: client.playlist_tracks(playlist_id, **params),
+            )
+
+    return await asyncio.gather(
+        *(fetch_page(offset) for offset in range(start, end, _PLAYLIST_PAGE_SIZE))
+    )
+
+
 @tool(
     description="Add tracks to an existing Spotify playlist and return updated playlist data",
     parse_docstring=True,
 )
 @traceable(name="spotify_add_tracks_to_playlist")
-def add_tracks_to_playlist(
+async def add_tracks_to_playlist(
     config: RunnableConfig,
     playlist_id: str,
     track_uris: List[str],
@@ -578,64 +862,55 @@ def add_tracks_to_playlist(
     logger.info(f"Adding {len(track_uris)} tracks to playlist {playlist_id}")
 
     # Normalize track URIs (handles both full URIs and plain track IDs)
-    valid_uris = _normalize_track_uris(track_uris)
-    if len(valid_uris) < len(track_uris):
-        logger.info(
-            f"Normalized {len(track_uris)} track inputs to {len(valid_uris)} valid URIs"
-        )
+    valid_uris = _unique_track_uris(track_uris)
 
     if not valid_uris:
         logger.error("No valid track URIs after normalization")
         return {"error": "No valid track URIs provided"}
 
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        if not _spotify_available(config):
             logger.error("Spotify client not found in config")
             return {"error": "Spotify client not available"}
 
-        # Add tracks in chunks
-        chunk_size = 100
-        tracks_added = 0
-        for i in range(0, len(valid_uris), chunk_size):
-            chunk = valid_uris[i : i + chunk_size]
-            spotify_client.playlist_add_items(playlist_id, chunk)
-            tracks_added += len(chunk)
-            logger.debug(
-                f"Added {len(chunk)} tracks to playlist {playlist_id} (total: {tracks_added})"
-            )
+        # Add tracks in chunks of 100. Each request appends to the end of the
+        # playlist, so chunks go one at a time to keep the curated order.
+        chunks = [
+            valid_uris[i : i + _SPOTIFY_PLAYLIST_ADD_MAX]
+            for i in range(0, len(valid_uris), _SPOTIFY_PLAYLIST_ADD_MAX)
+        ]
+        logger.info(f"Adding {len(valid_uris)} tracks in {len(chunks)} chunks")
+        try:
+            for chunk in chunks:
+                await _add_track_chunk(config, playlist_id, chunk)
+        finally:
+            # Even a partial upload changes the playlist
+            await playlist_cache.delete(playlist_id)
+        tracks_added = len(valid_uris)
         logger.info(
             f"Successfully added {tracks_added} tracks to playlist {playlist_id}"
         )
 
-        # Fetch and return updated playlist data so UI can update
-        playlist_full = spotify_client.playlist(playlist_id)
-        tracks_result = spotify_client.playlist_tracks(playlist_id, limit=100)
-
-        tracks = []
-        for item in tracks_result["items"]:
-            if item["track"]:
-                track = item["track"]
-                album = track.get("album", {})
-                artists = track.get("artists", [])
-                album_images = album.get("images", [])
-                album_cover = album_images[0]["url"] if album_images else None
-
-                track_data = {
-                    "id": track["id"],
-                    "name": track["name"],
-                    "artist": ", ".join([artist["name"] for artist in artists]),
-                    "album": album.get("name", ""),
-                    "uri": track["uri"],
-                    "duration_ms": track["duration_ms"],
-                    "popularity": track.get("popularity", 0),
-                    "album_cover": album_cover,
-                    "preview_url": track.get("preview_url"),
-                    "external_urls": track.get("external_urls", {}),
-                }
-                tracks.append(track_data)
+        # Fetch and return updated playlist data so UI can update. The playlist
+        # object embeds the first page of tracks, so one request covers both.
+        playlist_full = await _spotify_request(
+            config,
+            f"/playlists/{playlist_id}",
+            {"fields": _PLAYLIST_FIELDS},
+            lambda client: client.playlist(playlist_id, fields=_PLAYLIST_FIELDS),
+        )
+        first_page = playlist_full["tracks"]
+        pages = [first_page]
+        pages += await _fetch_playlist_pages(
+            config, playlist_id, len(first_page["items"]), first_page["total"]
+        )
+
+        tracks = [
+            _item_to_rich_track_dict(item["track"])
+            for page in pages
+            for item in page["items"]
+            if item["track"]
+        ]
 
         playlist_data = {
             "id": playlist_full["id"],
@@ -664,60 +939,52 @@ def add_tracks_to_playlist(
     description="Retrieve tracks from a Spotify playlist with album cover information",
     parse_docstring=True,
 )
-def get_playlist_tracks(
+async def get_playlist_tracks(
     config: RunnableConfig,
     playlist_id: str,
-    limit: int = 100,
+    limit: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Get tracks from a Spotify playlist including album cover information.
 
     Args:
         config: Configuration containing spotify_client in a 'configurable' dict.
         playlist_id: Playlist ID to retrieve tracks from.
-        limit: Maximum number of tracks to return. Default is 100.
+        limit: Maximum number of tracks to return. Default is all tracks.
 
     Returns:
         Dictionary containing playlist info and tracks with album covers, or empty dict if failed.
     """
     logger.info(f"Getting tracks from playlist {playlist_id}")
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        if not _spotify_available(config):
             logger.error("Spotify client not found in config")
             return {}
 
-        # Get playlist info
-        playlist = spotify_client.playlist(playlist_id)
-
-        # Get playlist tracks
-        tracks_result = spotify_client.playlist_tracks(playlist_id, limit=limit)
-
-        tracks = []
-        for item in tracks_result["items"]:
-            if item["track"]:  # Check if track exists
-                track = item["track"]
-                album = track.get("album", {})
-                artists = track.get("artists", [])
-
-                # Extract album cover URLs
-                album_images = album.get("images", [])
-                album_cover = album_images[0]["url"] if album_images else None
-
-                track_data = {
-                    "id": track["id"],
-                    "name": track["name"],
-                    "artist": ", ".join([artist["name"] for artist in artists]),
-                    "album": album.get("name", ""),
-                    "uri": track["uri"],
-                    "duration_ms": track["duration_ms"],
-                    "popularity": track.get("popularity", 0),
-                    "album_cover": album_cover,
-                    "preview_url": track.get("preview_url"),
-                    "external_urls": track.get("external_urls", {}),
-                }
-                tracks.append(track_data)
+        # Get playlist info and the first page of tracks together
+        first_page_limit = (
+            _PLAYLIST_PAGE_SIZE if limit is None else min(limit, _PLAYLIST_PAGE_SIZE)
+        )
+        playlist, pages = await asyncio.gather(
+            _spotify_request(
+                config,
+                f"/playlists/{playlist_id}",
+                {"fields": _PLAYLIST_INFO_FIELDS},
+                lambda client: client.playlist(playlist_id),
+            ),
+            _fetch_playlist_pages(config, playlist_id, 0, first_page_limit),
+        )
+        total = playlist["tracks"]["total"]
+
+        # Once the total is known, fetch any remaining pages concurrently
+        end = total if limit is None else min(limit, total)
+        pages += await _fetch_playlist_pages(config, playlist_id, first_page_limit, end)
+
+        tracks = [
+            _item_to_rich_track_dict(item["track"])
+            for page in pages
+            for item in page["items"]
+            if item["track"]
+        ]
 
         playlist_data = {
             "id": playlist["id"],
@@ -725,7 +992,7 @@ def get_playlist_tracks(
             "description": playlist.get("description", ""),
             "public": playlist["public"],
             "collaborative": playlist["collaborative"],
-            "total_tracks": playlist["tracks"]["total"],
+            "total_tracks": len(tracks),
             "owner": playlist.get("owner", {}).get("display_name") or "Unknown",
             "tracks": tracks,
             "images": playlist.get("images") or [],
@@ -746,7 +1013,7 @@ def get_playlist_tracks(
     parse_docstring=True,
 )
 @traceable(name="spotify_create_and_populate_playlist")
-def create_and_populate_playlist(
+async def create_and_populate_playlist(
     config: RunnableConfig,
     name: str,
     track_uris: List[str],
@@ -785,11 +1052,7 @@ def create_and_populate_playlist(
         return {"error": "Playlist name cannot be empty."}
 
     # Normalize track URIs (handles both full URIs and plain track IDs)
-    valid_uris = _normalize_track_uris(track_uris)
-    if len(valid_uris) < len(track_uris):
-        logger.info(
-            f"Normalized {len(track_uris)} track inputs to {len(valid_uris)} valid URIs"
-        )
+    valid_uris = _unique_track_uris(track_uris)
 
     if not valid_uris:
         logger.error("No valid Spotify track URIs found after normalization")
@@ -798,82 +1061,86 @@ def create_and_populate_playlist(
         }
 
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        if not _spotify_available(config):
             logger.error("Spotify client not found in config")
             return {"error": "Spotify client not available. Please try again."}
 
         # Step 1: Create the playlist
         logger.info("Step 1/3: Creating playlist...")
-        user_info = spotify_client.current_user()
-        user_id = user_info["id"]
-
-        playlist = spotify_client.user_playlist_create(
-            user=user_id, name=name.strip(), public=public, description=description
+        playlist = await _create_user_playlist(
+            config, name.strip(), public, description
         )
         playlist_id = playlist["id"]
         logger.info(f"✅ Created playlist '{name}' with ID: {playlist_id}")
 
-        # Step 2: Add tracks in chunks of 100
-        logger.info(f"Step 2/3: Adding {len(valid_uris)} tracks...")
-        chunk_size = 100
-        tracks_added = 0
-        for i in range(0, len(valid_uris), chunk_size):
-            chunk = valid_uris[i : i + chunk_size]
+        # Step 2: Add tracks in chunks of 100. Each request appends to the end of
+        # the playlist, so chunks go one at a time to keep the curated order.
+        chunks = [
+            valid_uris[i : i + _SPOTIFY_PLAYLIST_ADD_MAX]
+            for i in range(0, len(valid_uris), _SPOTIFY_PLAYLIST_ADD_MAX)
+        ]
+        logger.info(
+            f"Step 2/3: Adding {len(valid_uris)} tracks in {len(chunks)} chunks..."
+        )
+        # Playlist order: the chunks that made it in, in upload order
+        added_uris = []
+        for index, chunk in enumerate(chunks, start=1):
             try:
-                spotify_client.playlist_add_items(playlist_id, chunk)
-                tracks_added += len(chunk)
-                logger.debug(
-                    f"Added {len(chunk)} tracks to playlist {playlist_id} (total: {tracks_added})"
-                )
-            except Exception as chunk_error:
-                logger.error(f"Error adding chunk {i//chunk_size + 1}: {chunk_error}")
-                # Continue with remaining chunks
+                await _add_track_chunk(config, playlist_id, chunk)
+            except Exception as e:
+                # Keep going so the chunks that do make it in stay usable
+                logger.error(f"Error adding chunk {index}: {e}")
+            else:
+                added_uris.extend(chunk)
         logger.info(
-            f"✅ Added {tracks_added}/{len(valid_uris)} tracks to playlist {playlist_id}"
+            f"✅ Added {len(added_uris)}/{len(valid_uris)} tracks to playlist {playlist_id}"
         )
 
-        # Step 3: Retrieve full playlist data with track details
-        logger.info("Step 3/3: Retrieving playlist data...")
-        playlist_full = spotify_client.playlist(playlist_id)
-        tracks_result = spotify_client.playlist_tracks(playlist_id, limit=100)
-
-        tracks = []
-        for item in tracks_result["items"]:
-            if item["track"]:
-                track = item["track"]
-                album = track.get("album", {})
-                artists = track.get("artists", [])
-                album_images = album.get("images", [])
-                album_cover = album_images[0]["url"] if album_images else None
-
-                track_data = {
-                    "id": track["id"],
-                    "name": track["name"],
-                    "artist": ", ".join([artist["name"] for artist in artists]),
-                    "album": album.get("name", ""),
-                    "uri": track["uri"],
-                    "duration_ms": track["duration_ms"],
-                    "popularity": track.get("popularity", 0),
-                    "album_cover": album_cover,
-                    "preview_url": track.get("preview_url"),
-                    "external_urls": track.get("external_urls", {}),
-                }
-                tracks.append(track_data)
+        # Step 3: Describe the playlist from the creation response. The tracks
+        # normally come from earlier searches, so their details are already
+        # known; look up only the ones that aren't.
+        missing_ids = [
+            uri.rsplit(":", 1)[1] for uri in added_uris if uri not in _track_details
+        ]
+        if missing_ids:
+            logger.info(
+                f"Step 3/3: Fetching details for {len(missing_ids)} uncached tracks..."
+            )
+            id_batches = [
+                missing_ids[i : i + _TRACKS_BATCH_SIZE]
+                for i in range(0, len(missing_ids), _TRACKS_BATCH_SIZE)
+            ]
+            responses = await asyncio.gather(
+                *(
+                    _spotify_request(
+                        config,
+                        "/tracks",
+                        {"ids": ",".join(batch)},
+                        lambda client, batch=batch: client.tracks(batch),
+                    )
+                    for batch in id_batches
+                )
+            )
+            for response in responses:
+                _remember_tracks(response["tracks"])
+        else:
+            logger.info("Step 3/3: Building playlist data from known tracks")
+
+        tracks = [
+            track for track in map(_track_details.get, added_uris) if track is not None
+        ]
 
         playlist_data = {
-            "id": playlist_full["id"],
-            "name": playlist_full["name"],
-            "description": playlist_full.get("description", ""),
-            "public": playlist_full["public"],
-            "collaborative": playlist_full["collaborative"],
+            "id": playlist["id"],
+            "name": playlist["name"],
+            "description": playlist.get("description", ""),
+            "public": playlist["public"],
+            "collaborative": playlist["collaborative"],
             "total_tracks": len(tracks),
-            "owner": playlist_full.get("owner", {}).get("display_name") or "Unknown",
+            "owner": playlist.get("owner", {}).get("display_name") or "Unknown",
             "tracks": tracks,
-            "images": playlist_full.get("images") or [],
-            "external_urls": playlist_full.get("external_urls", {}),
+            "images": playlist.get("images") or [],
+            "external_urls": playlist.get("external_urls", {}),
         }
 
         logger.info(
@@ -884,7 +1151,8 @@ def create_and_populate_playlist(
         logger.error(f"Spotify API error creating playlist '{name}': {spotify_error}")
         return {"error": f"Spotify API error: {str(spotify_error)}. Please try again."}
     except Exception as e:
-        logger.error(f"Error creating/populating playlist '{name}': {e}", exc_info=True)
+        logger.error(f"Error creating/populating playlist '{name}': {e}")
+        logger.debug("Traceback for playlist creation failure", exc_info=True)
         return {"error": f"Failed to create playlist: {str(e)}. Please try again."}
 
 
@@ -892,7 +1160,7 @@ def create_and_populate_playlist(
     description="Remove tracks from an existing Spotify playlist using the spotipy client",
     parse_docstring=True,
 )
-def remove_tracks_from_playlist(
+async def remove_tracks_from_playlist(
     config: RunnableConfig,
     playlist_id: str,
     track_uris: List[str],
@@ -909,17 +1177,21 @@ def remove_tracks_from_playlist(
     """
     logger.info(f"Removing {len(track_uris)} tracks from playlist {playlist_id}")
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        if not _spotify_available(config):
             logger.error("Spotify client not found in config")
             return False
 
-        tracks_to_remove = [{"uri": uri} for uri in track_uris]
-        spotify_client.playlist_remove_all_occurrences_of_items(
-            playlist_id, [t["uri"] for t in tracks_to_remove]
+        await _spotify_request(
+            config,
+            f"/playlists/{playlist_id}/tracks",
+            {},
+            lambda client: client.playlist_remove_all_occurrences_of_items(
+                playlist_id, track_uris
+            ),
+            method="DELETE",
+            json={"tracks": [{"uri": uri} for uri in track_uris]},
         )
+        await playlist_cache.delete(playlist_id)
         logger.info(
             f"Successfully removed {len(track_uris)} tracks from playlist {playlist_id}"
         )
@@ -929,11 +1201,52 @@ def remove_tracks_from_playlist(
         return False
 
 
+# The audio-features endpoint accepts up to 100 IDs per request
+_AUDIO_FEATURES_BATCH_SIZE = 100
+_AUDIO_FEATURES_CONCURRENCY = 4
+
+
+async def _fetch_audio_features(
+    config: RunnableConfig, track_ids: List[str]
+) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+    """Fetch audio features for many tracks, 100 IDs per request, several requests at once.
+
+    Returns:
+        A mapping of track ID to its audio features (None where Spotify has none),
+        or None if no Spotify credentials are configured.
+    """
+    if not _spotify_available(config):
+        return None
+
+    batches = [
+        track_ids[i : i + _AUDIO_FEATURES_BATCH_SIZE]
+        for i in range(0, len(track_ids), _AUDIO_FEATURES_BATCH_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(_AUDIO_FEATURES_CONCURRENCY)
+
+    async def fetch_batch(batch: List[str]) -> List[Optional[Dict[str, Any]]]:
+        async with semaphore:
+            results = await _spotify_request(
+                config,
+                "/audio-features",
+                {"ids": ",".join(batch)},
+                lambda client: {"audio_features": client.audio_features(batch)},
+            )
+        return results["audio_features"] or [None] * len(batch)
+
+    responses = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+    return {
+        track_id: features
+        for batch, batch_features in zip(batches, responses)
+        for track_id, features in zip(batch, batch_features)
+    }
+
+
 @tool(
     description="Retrieve detailed audio features for a Spotify track using the spotipy client",
     parse_docstring=True,
 )
-def get_audio_features(
+async def get_audio_features(
     config: RunnableConfig,
     track_id: str,
 ) -> Optional[Dict[str, Any]]:
@@ -949,19 +1262,16 @@ def get_audio_features(
     """
     logger.info(f"Getting audio features for track {track_id}")
     try:
-        spotify_client = (
-            config["configurable"].get("spotify_client") if config else None
-        )
-        if not spotify_client:
+        features = await _fetch_audio_features(config, [track_id])
+        if features is None:
             logger.error("Spotify client not found in config")
             return None
 
-        features = spotify_client.audio_features([track_id])
-        if not features or not features[0]:
+        audio_features = features.get(track_id)
+        if not audio_features:
             logger.error(f"No audio features found for track {track_id}")
             return None
 
-        audio_features = features[0]
         logger.info(f"Retrieved audio features for track {track_id}")
         return audio_features
     except Exception as e:
@@ -969,6 +1279,71 @@ def get_audio_features(
         return None
 
 
+@tool(
+    description="Retrieve audio features for many Spotify tracks at once. Prefer this over repeated get_audio_features calls when analyzing several tracks or a whole playlist",
+    parse_docstring=True,
+)
+async def get_audio_features_batch(
+    config: RunnableConfig,
+    track_ids: List[str],
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Get audio features for several Spotify tracks.
+
+    Args:
+        config: Configuration containing spotify_client in a 'configurable' dict.
+        track_ids: The Spotify track IDs.
+
+    Returns:
+        A dictionary mapping each track ID to its audio features (e.g., acousticness, danceability, energy, etc.),
+        or to None if Spotify has none for it. Empty if the request failed.
+    """
+    unique_ids = list(dict.fromkeys(track_ids))
+    logger.info(f"Getting audio features for {len(unique_ids)} tracks")
+    try:
+        features = await _fetch_audio_features(config, unique_ids)
+        if features is None:
+            logger.error("Spotify client not found in config")
+            return {}
+
+        logger.info(
+            f"Retrieved audio features for {sum(f is not None for f in features.values())}/{len(unique_ids)} tracks"
+        )
+        return features
+    except Exception as e:
+        logger.error(f"Error getting audio features for {len(unique_ids)} tracks: {e}")
+        return {}
+
+
+# Filler words that don't change what a web search is about
+_QUERY_STOPWORDS = frozenset(
+    {"a", "an", "and", "the", "of", "in", "on", "for", "to", "by", "from", "with"}
+)
+_QUERY_WORD_RE = re.compile(r"[\w']+")
+
+
+def _tavily_query_key(query: str) -> str:
+    """Reduce a query to its content words so trivially different phrasings share a cache slot.
+
+    Case, punctuation and stopwords are dropped but word order is kept, since
+    reordering can change the meaning: "Drake songs featuring Rihanna" is not
+    "Rihanna songs featuring Drake". "The Beatles, in 1965!" becomes "beatles 1965".
+    """
+    words = _QUERY_WORD_RE.findall(query.casefold())
+    content_words = [word for word in words if word not in _QUERY_STOPWORDS]
+    return " ".join(content_words or words)
+
+
+# tavily_search is sync, so ToolNode runs it on worker threads; the per-thread
+# LRU search caches are not thread-safe (a read reorders, a write may evict)
+_search_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _tavily_client(max_results: int) -> TavilySearch:
+    """TavilySearch tool for a result count, built once and reused across calls."""
+    return TavilySearch(max_results=max_results, topic="general")
+
+
 @tool(
     description="Search the web for music history, cultural context, trends, and artist information not available in Spotify",
     parse_docstring=True,
@@ -1000,21 +1375,24 @@ def tavily_search(
     logger.info(f"Performing web search: query='{query}', max_results={max_results}")
 
     # Check cache first
+    cache_key = (_tavily_query_key(query), max_results)
     search_cache = config.get("configurable", {}).get("search_cache", {})
-    if query in search_cache:
+    with _search_cache_lock:
+        cached = search_cache.get(cache_key)
+    if cached is not None:
         logger.info(f"🎯 Cache HIT for Tavily search: '{query}'")
-        return search_cache[query]
+        return cached
 
     logger.info(f"🔍 Cache MISS for Tavily search: '{query}' - performing search")
     try:
-        search = TavilySearch(max_results=max_results, topic="general")
-        results = search.invoke({"query": query})
+        results = _tavily_client(max_results).invoke({"query": query})
         results_str = str(results)
 
         # Write result to cache
-        config.setdefault("configurable", {}).setdefault("search_cache", {})[
-            query
-        ] = results_str
+        with _search_cache_lock:
+            config.setdefault("configurable", {}).setdefault("search_cache", {})[
+                cache_key
+            ] = results_str
         logger.info(f"💾 Cached Tavily search for: '{query}'")
 
         return results_str
@@ -1026,6 +1404,7 @@ def tavily_search(
 # Export all tools for the agent
 tools = [
     search_tracks,
+    search_tracks_batch,
     search_artists,
     get_artist_top_tracks,
     get_track_recommendations,
@@ -1037,5 +1416,6 @@ tools = [
     get_playlist_tracks,
     remove_tracks_from_playlist,
     get_audio_features,
+    get_audio_features_batch,
     tavily_search,
 ]
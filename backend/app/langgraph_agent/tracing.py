@@ -0,0 +1,45 @@
+"""LangSmith tracing setup shared by the agent graph and its tools.
+
+Tracing is resolved once at import time. When it is disabled (or langsmith is
+not installed) ``traceable`` degrades to an identity decorator, so traced
+functions run unwrapped without an extra Python frame per call.
+"""
+
+import os
+
+from ..core.config import settings
+
+
+def _identity_traceable(*args, **kwargs):
+    """No-op stand-in supporting both ``@traceable`` and ``@traceable(name=...)``."""
+    if args and callable(args[0]):
+        return args[0]
+    return lambda func: func
+
+
+tracing_enabled = (
+    bool(settings.langsmith_api_key) and settings.langsmith_tracing_enabled
+)
+langsmith_client = None
+
+try:
+    from langsmith import traceable as _langsmith_traceable
+    from langsmith import Client as LangSmithClient
+except ImportError:
+    print("⚠️  LangSmith not available - install langsmith package for tracing")
+    tracing_enabled = False
+    traceable = _identity_traceable
+else:
+    if tracing_enabled:
+        langsmith_client = LangSmithClient(
+            api_key=settings.langsmith_api_key,
+            api_url=os.getenv("LANGSMITH_API_URL", "https://api.smith.langchain.com"),
+        )
+        # Set environment variables for automatic tracing
+        os.environ["LANGCHAIN_TRACING_V2"] = "true"
+        os.environ["LANGCHAIN_PROJECT"] = settings.langsmith_project
+        traceable = _langsmith_traceable
+        print("✅ LangSmith tracing initialized")
+    else:
+        traceable = _identity_traceable
+        print("ℹ️  LangSmith tracing disabled - no API key provided")
@@ -10,13 +10,15 @@ from datetime import datetime, timezone
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .core.config import settings
 from .routers import api, chat
+from .services import spotify_api
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=settings.log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
         logging.StreamHandler(),
@@ -26,12 +28,24 @@ logger = logging.getLogger(__name__)
 
 # Set specific loggers to appropriate levels
 logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("spotipy").setLevel(logging.WARNING)
 logging.getLogger("uvicorn.access").setLevel(logging.INFO)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled Spotify API connections on shutdown"""
+    yield
+    await spotify_api.aclose()
+
+
 app = FastAPI(
     title="Mr. DJ",
     description="FastAPI backend with LangGraph agent for Spotify playlist creation by Mr. DJ",
     version="1.0.0",
+    lifespan=lifespan,
+    # Playlist payloads can carry hundreds of tracks; orjson encodes them much faster
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware - Allow both development and production origins
@@ -52,8 +66,11 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the frontend sends; wildcards make every preflight echo the request back
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    # Let browsers cache preflight responses for a day instead of 10 minutes
+    max_age=86400,
 )
 
 # Include routers
@@ -81,4 +98,8 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] picks uvloop and httptools where available. Workers
+    # default to one (or WEB_CONCURRENCY): conversation checkpoints live in
+    # process memory, so more workers would split a thread's history across
+    # processes.
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000)
@@ -3,17 +3,61 @@ API router using service account
 All operations use your dedicated Spotify service account
 """
 
+import asyncio
 import logging
+from typing import Any, Dict
+
 from fastapi import APIRouter, HTTPException, status
 
 from app.api.models import PlaylistData
 
+from ..langgraph_agent.tools import get_playlist_tracks, playlist_cache
 from ..services.spotify_service import spotify_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# playlist_id → in-flight fetch, so concurrent duplicate requests share one call
+_playlist_fetches: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+async def _fetch_playlist(playlist_id: str) -> Dict[str, Any]:
+    """Fetch a playlist from Spotify and cache it unless it was edited meanwhile."""
+    # A tool editing the playlist during the fetch bumps this, and the then
+    # stale result is returned to the waiters but not cached
+    generation = playlist_cache.generation(playlist_id)
+    # Use the get_playlist_tracks tool over the async Web API client
+    config = {
+        "configurable": {
+            "spotify_client": await spotify_service.get_client(),
+            "spotify_token": await spotify_service.get_access_token(),
+            "spotify_token_provider": spotify_service.get_access_token,
+        }
+    }
+    playlist_data = await get_playlist_tracks.ainvoke(
+        {"playlist_id": playlist_id}, config
+    )
+    if playlist_data:
+        await playlist_cache.set(playlist_id, playlist_data, generation=generation)
+    return playlist_data
+
+
+async def _load_playlist(playlist_id: str) -> Dict[str, Any]:
+    """Return a playlist, reusing a fresh cached copy or an identical in-flight fetch."""
+    playlist_data = await playlist_cache.get(playlist_id)
+    if playlist_data is not None:
+        return playlist_data
+
+    fetch = _playlist_fetches.get(playlist_id)
+    if fetch is None:
+        fetch = asyncio.create_task(_fetch_playlist(playlist_id))
+        _playlist_fetches[playlist_id] = fetch
+        fetch.add_done_callback(lambda _: _playlist_fetches.pop(playlist_id, None))
+
+    # Shielded so one client disconnecting doesn't cancel the fetch for the others
+    return await asyncio.shield(fetch)
+
 
 @router.get("/service-user")
 async def get_service_user():
@@ -37,26 +81,17 @@ async def get_service_user():
 
 
 @router.get("/playlist/{playlist_id}", response_model=PlaylistData)
-async def get_playlist(playlist_id: str, config):
+async def get_playlist(playlist_id: str):
     """Get playlist information using service account"""
     try:
-        # Use service account client
-
-        # Use the get_playlist_tracks tool
-        from ..langgraph_agent.tools import get_playlist_tracks
-
-        config = {"configurable": {"spotify_client": spotify_service}}
-
-        playlist_data = get_playlist_tracks.invoke(
-            {"playlist_id": playlist_id, "limit": 100}, config
-        )
+        playlist_data = await _load_playlist(playlist_id)
 
         if not playlist_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Playlist not found"
             )
 
-        return PlaylistData(**playlist_data)
+        return playlist_data
 
     except HTTPException:
         raise
@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import RedirectResponse
 
 from ..services.spotify_service import spotify_service
+from ..langgraph_agent.tools import clear_user_info_cache
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -97,6 +98,7 @@ async def refresh_service_account():
     try:
         # Clear the current client to force token refresh on next request
         spotify_service._spotify_client = None
+        clear_user_info_cache()
 
         # Validate to trigger refresh
         service_validation = await spotify_service.validate_service_account()
@@ -2,17 +2,18 @@
 Chat router for LangGraph agent integration
 """
 
-import uuid
 import logging
+import secrets
 import spotipy
 import os
-import json
 import asyncio
+from typing import Any, Dict
+import orjson
 from fastapi import APIRouter, HTTPException, status, Request
 from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage
 
-from ..api.models import ChatRequest, ChatResponse, PlaylistData
+from ..api.models import ChatRequest, ChatResponse, PlaylistData, PlaylistTrack
 from ..services.spotify_service import spotify_service
 from ..langgraph_agent.agent import assistant_ui_graph
 from ..core.config import settings
@@ -22,20 +23,59 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Agent runs allowed at once; each holds its conversation state, tool results
+# and LLM calls in memory, so bursts beyond this wait briefly and then get a 503
+_agent_slots = asyncio.Semaphore(settings.agent_max_concurrency)
+_AGENT_SLOT_TIMEOUT = 10
+
+
+async def _acquire_agent_slot() -> None:
+    """Wait for a free agent slot, or raise 503 so the client backs off."""
+    try:
+        await asyncio.wait_for(_agent_slots.acquire(), timeout=_AGENT_SLOT_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "🚦 All %d agent slots busy, rejecting request",
+            settings.agent_max_concurrency,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Mr. DJ is busy right now. Please try again in a moment.",
+        )
+
+
+def _normalize_playlist(playlist_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in the fields PlaylistData requires, in place, and return the dict."""
+    tracks = playlist_data.get("tracks")
+    if not isinstance(tracks, list):
+        tracks = playlist_data["tracks"] = []
+    playlist_data.setdefault("total_tracks", len(tracks))
+    playlist_data["owner"] = playlist_data.get("owner") or "Unknown"
+    playlist_data.setdefault("images", [])
+    playlist_data.setdefault("external_urls", {})
+    return playlist_data
+
+
+def _sse_event(payload: dict) -> bytes:
+    """Encode one Server-Sent Event; the final event can carry a full playlist"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(chat_request: ChatRequest, request: Request):
     """Chat endpoint that integrates with LangGraph agent using service account"""
 
     logger.info("🚀 Chat request received (no authentication required)")
-    logger.debug(f"📝 Message: {chat_request.message}")
-    logger.debug(f"🔗 Thread ID: {chat_request.thread_id}")
+    logger.debug("📝 Message: %s", chat_request.message)
+    logger.debug("🔗 Thread ID: %s", chat_request.thread_id)
 
     spotify_client = await spotify_service.get_client()
+    spotify_token = await spotify_service.get_access_token()
 
     try:
         # Generate thread_id if not provided
-        thread_id = chat_request.thread_id or str(uuid.uuid4())
-        logger.info(f"🧵 Using thread ID: {thread_id}")
+        thread_id = chat_request.thread_id or secrets.token_hex(16)
+        logger.info("🧵 Using thread ID: %s", thread_id, extra={"thread_id": thread_id})
 
         ultrathink_enabled = bool(chat_request.ultrathink)
         selected_model = settings.openrouter_model
@@ -53,33 +93,42 @@ async def chat_endpoint(chat_request: ChatRequest, request: Request):
                 "messages": [HumanMessage(content=chat_request.message)],
                 "user_intent": chat_request.message,
             }
-        logger.debug(f"📋 Initial state prepared: {initial_state}")
+        logger.debug("📋 Initial state prepared: %s", initial_state)
 
         # Configuration for the agent
         config = {
             "configurable": {
                 "thread_id": thread_id,
                 "spotify_client": spotify_client,
+                "spotify_token": spotify_token,
+                "spotify_token_provider": spotify_service.get_access_token,
+                "user_id": settings.spotify_service_user_id,
                 "openrouter_model_override": selected_model,
             },
             "recursion_limit": 100,
         }
-        logger.debug(f"⚙️  Agent config prepared")
+        logger.debug("⚙️  Agent config prepared")
 
         # Call the LangGraph agent
+        # %.100s truncates the preview only if the record is actually emitted
         logger.info(
-            f"🤖 Calling LangGraph agent with message: '{chat_request.message[:100]}{'...' if len(chat_request.message) > 100 else ''}'"
+            "🤖 Calling LangGraph agent with message: '%.100s'",
+            chat_request.message,
+            extra={"thread_id": thread_id},
         )
 
+        await _acquire_agent_slot()
         try:
             result = await assistant_ui_graph.ainvoke(initial_state, config)
-            logger.info(f"✅ Agent completed successfully")
-            logger.debug(f"📤 Agent result: {result}")
+            logger.info("✅ Agent completed successfully")
+            logger.debug("📤 Agent result: %s", result)
         except Exception as agent_error:
-            logger.error(f"💥 Agent execution failed: {agent_error}")
-            logger.error(f"Agent error type: {type(agent_error).__name__}")
-            logger.error(f"Agent error details: {str(agent_error)}", exc_info=True)
+            logger.error("💥 Agent execution failed: %s", agent_error)
+            logger.error("Agent error type: %s", type(agent_error).__name__)
+            logger.error("Agent error details: %s", agent_error, exc_info=True)
             raise
+        finally:
+            _agent_slots.release()
 
         # Extract the final message
         if result and result.get("messages"):
@@ -89,9 +138,7 @@ async def chat_endpoint(chat_request: ChatRequest, request: Request):
                 if hasattr(final_message, "content")
                 else str(final_message)
             )
-            logger.debug(
-                f"📝 Final message content: {response_content[:200]}{'...' if len(str(response_content)) > 200 else ''}"
-            )
+            logger.debug("📝 Final message content: %.200s", response_content)
         else:
             logger.warning("⚠️  No messages in result, using fallback response")
             response_content = "I apologize, but I encountered an issue processing your request. Please try again."
@@ -99,43 +146,56 @@ async def chat_endpoint(chat_request: ChatRequest, request: Request):
         # Extract playlist data if available
         playlist_data = result.get("playlist_data") if result else None
         if playlist_data:
-            # Ensure data consistency before creating PlaylistData model
-            tracks = playlist_data.get("tracks", [])
-            if not isinstance(tracks, list):
-                tracks = []
-                playlist_data["tracks"] = tracks
-
-            # Ensure all required fields are present with proper types
-            playlist_data.setdefault("total_tracks", len(tracks))
-            playlist_data["owner"] = playlist_data.get("owner") or "Unknown"
-            playlist_data.setdefault("images", [])
-            playlist_data.setdefault("external_urls", {})
-
-            track_count = len(tracks)
+            tracks = _normalize_playlist(playlist_data)["tracks"]
+
             logger.debug(
-                f"🎵 Playlist data found in result: {playlist_data.get('name', 'Unknown')} with {track_count} tracks"
+                "🎵 Playlist data found in result: %s with %d tracks",
+                playlist_data.get("name", "Unknown"),
+                len(tracks),
             )
 
         # Log final state for debugging
         logger.debug(
-            f"📊 Final agent state: user_intent='{result.get('user_intent')}', playlist_id={result.get('playlist_id')}, playlist_name='{result.get('playlist_name')}'"
+            "📊 Final agent state: user_intent=%r, playlist_id=%s, playlist_name=%r",
+            result.get("user_intent"),
+            result.get("playlist_id"),
+            result.get("playlist_name"),
         )
 
-        logger.info(f"✅ Chat processing completed successfully for thread {thread_id}")
+        logger.info(
+            "✅ Chat processing completed successfully for thread %s",
+            thread_id,
+            extra={"thread_id": thread_id},
+        )
+
+        # playlist_data was built by our own tools, and FastAPI validates the
+        # response against ChatResponse anyway; skip the extra validation pass
+        # (tracks are constructed too so serialization sees the declared types)
+        if playlist_data:
+            playlist_data = PlaylistData.model_construct(
+                **{
+                    **playlist_data,
+                    "tracks": [
+                        PlaylistTrack.model_construct(**track) for track in tracks
+                    ],
+                }
+            )
 
         return ChatResponse(
             message=response_content,
             thread_id=thread_id,
-            playlist_data=PlaylistData(**playlist_data) if playlist_data else None,
+            playlist_data=playlist_data,
         )
 
     except HTTPException as http_error:
-        logger.error(f"🔴 HTTP Error: {http_error.status_code} - {http_error.detail}")
+        logger.error(
+            "🔴 HTTP Error: %s - %s", http_error.status_code, http_error.detail
+        )
         raise
     except Exception as e:
-        logger.error(f"💥 Unexpected error in chat endpoint: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error details:", exc_info=True)
+        logger.error("💥 Unexpected error in chat endpoint: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
+        logger.error("Error details:", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Chat processing failed: {str(e)}",
@@ -147,16 +207,25 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
     """Streaming chat endpoint that sends tool call updates via Server-Sent Events"""
 
     logger.info("🚀 Streaming chat request received")
-    logger.debug(f"📝 Message: {chat_request.message}")
-    logger.debug(f"🔗 Thread ID: {chat_request.thread_id}")
+    logger.debug("📝 Message: %s", chat_request.message)
+    logger.debug("🔗 Thread ID: %s", chat_request.thread_id)
 
     async def event_generator():
+        try:
+            await _acquire_agent_slot()
+        except HTTPException as busy:
+            yield _sse_event({"type": "error", "message": busy.detail})
+            return
+
         try:
             spotify_client = await spotify_service.get_client()
+            spotify_token = await spotify_service.get_access_token()
 
             # Generate thread_id if not provided
-            thread_id = chat_request.thread_id or str(uuid.uuid4())
-            logger.info(f"🧵 Using thread ID: {thread_id}")
+            thread_id = chat_request.thread_id or secrets.token_hex(16)
+            logger.info(
+                "🧵 Using thread ID: %s", thread_id, extra={"thread_id": thread_id}
+            )
 
             ultrathink_enabled = bool(chat_request.ultrathink)
             selected_model = settings.openrouter_model
@@ -168,7 +237,7 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                 )
 
             # Send initial status
-            yield f"data: {json.dumps({'type': 'status', 'message': 'Starting...'})}\n\n"
+            yield _sse_event({"type": "status", "message": "Starting..."})
 
             # Prepare the state for the agent
             # Note: Do NOT set playlist_id/playlist_name to None here - let the checkpointer
@@ -183,17 +252,23 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                 "configurable": {
                     "thread_id": thread_id,
                     "spotify_client": spotify_client,
+                    "spotify_token": spotify_token,
+                    "spotify_token_provider": spotify_service.get_access_token,
+                    "user_id": settings.spotify_service_user_id,
                     "openrouter_model_override": selected_model,
                 },
                 "recursion_limit": 100,
             }
 
             # Call the LangGraph agent with streaming
-            logger.info(f"🤖 Calling LangGraph agent in streaming mode")
+            logger.info("🤖 Calling LangGraph agent in streaming mode")
 
             # Stream through agent execution and build up the final state
-            # Use a smarter merge that preserves important data like playlist_data
+            # Use a smarter merge that preserves important data like playlist_data.
+            # Only the latest message is needed for the reply, so earlier ones are
+            # released as the stream advances instead of held for the whole run.
             final_state = {"messages": []}
+            message_count = 0
             async for event in assistant_ui_graph.astream(initial_state, config):
                 # Check if client disconnected
                 if await request.is_disconnected():
@@ -203,9 +278,10 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                 # Process agent events and accumulate state
                 if "agent" in event:
                     agent_output = event["agent"]
-                    # Smart merge: append messages, preserve playlist data
-                    if "messages" in agent_output:
-                        final_state["messages"].extend(agent_output["messages"])
+                    # Smart merge: keep the latest message, preserve playlist data
+                    if agent_output.get("messages"):
+                        final_state["messages"] = agent_output["messages"][-1:]
+                        message_count += len(agent_output["messages"])
                     # Preserve playlist_data once it's set (don't overwrite with None)
                     for key in ["playlist_data", "playlist_id", "playlist_name"]:
                         if agent_output.get(key) is not None:
@@ -233,6 +309,7 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                                 # Map tool names to friendly messages
                                 tool_messages = {
                                     "search_tracks": "🔍 Searching for tracks...",
+                                    "search_tracks_batch": "🔍 Searching for tracks...",
                                     "search_artists": "👤 Searching for artists...",
                                     "get_artist_top_tracks": "🎵 Getting artist's top tracks...",
                                     "get_track_recommendations": "✨ Getting personalized recommendations...",
@@ -244,6 +321,7 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                                     "tavily_search": "🌐 Researching music context (Powered by Tavily)...",
                                     "get_user_info": "👤 Getting user information...",
                                     "get_audio_features": "🎚️ Analyzing audio features...",
+                                    "get_audio_features_batch": "🎚️ Analyzing audio features...",
                                     "remove_tracks_from_playlist": "➖ Removing tracks from playlist...",
                                 }
 
@@ -251,20 +329,33 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                                     tool_name, f"⚙️ Running {tool_name}"
                                 )
 
-                                yield f"data: {json.dumps({'type': 'tool_start', 'tool': tool_name, 'message': friendly_message})}\n\n"
+                                yield _sse_event(
+                                    {
+                                        "type": "tool_start",
+                                        "tool": tool_name,
+                                        "message": friendly_message,
+                                    }
+                                )
                                 await asyncio.sleep(0)  # Yield control
 
                 elif "tools" in event:
                     # Tool execution completed - smart merge tools output
                     tools_output = event["tools"]
-                    if "messages" in tools_output:
-                        final_state["messages"].extend(tools_output["messages"])
+                    if tools_output.get("messages"):
+                        final_state["messages"] = tools_output["messages"][-1:]
+                        message_count += len(tools_output["messages"])
                     # Preserve playlist_data once it's set (don't overwrite with None)
                     for key in ["playlist_data", "playlist_id", "playlist_name"]:
                         if tools_output.get(key) is not None:
                             final_state[key] = tools_output[key]
                             logger.info(
-                                f"🎵 Captured {key} from tools: {tools_output[key] if key != 'playlist_data' else tools_output[key].get('name', 'Unknown')}"
+                                "🎵 Captured %s from tools: %s",
+                                key,
+                                (
+                                    tools_output[key]
+                                    if key != "playlist_data"
+                                    else tools_output[key].get("name", "Unknown")
+                                ),
                             )
                     # Copy other fields
                     for key in tools_output:
@@ -276,7 +367,7 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                         ]:
                             final_state[key] = tools_output[key]
 
-                    yield f"data: {json.dumps({'type': 'tool_end'})}\n\n"
+                    yield _sse_event({"type": "tool_end"})
                     await asyncio.sleep(0)
 
             # Use the accumulated final state
@@ -287,7 +378,9 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
             # Log what we captured
             if result:
                 logger.info(
-                    f"📊 Streaming completed - messages: {len(result.get('messages', []))}, playlist_data: {'yes' if result.get('playlist_data') else 'no'}"
+                    "📊 Streaming completed - messages: %d, playlist_data: %s",
+                    message_count,
+                    "yes" if result.get("playlist_data") else "no",
                 )
 
             # If we didn't get a result from streaming, fall back to invoke
@@ -295,7 +388,8 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                 logger.warning("⚠️ No result from streaming, falling back to ainvoke")
                 result = await assistant_ui_graph.ainvoke(initial_state, config)
                 logger.info(
-                    f"📊 Fallback invoke - playlist_data: {'yes' if result.get('playlist_data') else 'no'}"
+                    "📊 Fallback invoke - playlist_data: %s",
+                    "yes" if result.get("playlist_data") else "no",
                 )
 
             # Extract the final message
@@ -313,15 +407,7 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
             # Extract playlist data if available
             playlist_data = result.get("playlist_data") if result else None
             if playlist_data:
-                tracks = playlist_data.get("tracks", [])
-                if not isinstance(tracks, list):
-                    tracks = []
-                    playlist_data["tracks"] = tracks
-
-                playlist_data.setdefault("total_tracks", len(tracks))
-                playlist_data["owner"] = playlist_data.get("owner") or "Unknown"
-                playlist_data.setdefault("images", [])
-                playlist_data.setdefault("external_urls", {})
+                _normalize_playlist(playlist_data)
 
             # Send final response
             final_response = {
@@ -331,18 +417,22 @@ async def chat_stream_endpoint(chat_request: ChatRequest, request: Request):
                 "playlist_data": playlist_data,
             }
 
-            yield f"data: {json.dumps(final_response)}\n\n"
+            yield _sse_event(final_response)
             logger.info(
-                f"✅ Streaming chat completed successfully for thread {thread_id}"
+                "✅ Streaming chat completed successfully for thread %s",
+                thread_id,
+                extra={"thread_id": thread_id},
             )
 
         except Exception as e:
-            logger.error(f"💥 Streaming error: {str(e)}", exc_info=True)
+            logger.error("💥 Streaming error: %s", e, exc_info=True)
             error_response = {
                 "type": "error",
                 "message": f"Chat processing failed: {str(e)}",
             }
-            yield f"data: {json.dumps(error_response)}\n\n"
+            yield _sse_event(error_response)
+        finally:
+            _agent_slots.release()
 
     return StreamingResponse(
         event_generator(),
@@ -0,0 +1,151 @@
+"""
+Async Spotify Web API access for the agent tools
+Uses one pooled HTTP/2 client so tool calls can run concurrently on the event loop
+"""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+SPOTIFY_API_BASE_URL = "https://api.spotify.com/v1"
+
+# Shared across all tool invocations so TCP/TLS connections are reused; idle
+# connections are kept warm for five minutes between agent turns
+_client = httpx.AsyncClient(
+    base_url=SPOTIFY_API_BASE_URL,
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=50, max_keepalive_connections=32, keepalive_expiry=300
+    ),
+    timeout=10,
+)
+
+
+# Spotify rate-limits per app over a rolling window; pace all tool traffic
+# below that and honour Retry-After if a 429 still comes back
+_REQUESTS_PER_SECOND = 10
+_MAX_RATE_LIMIT_RETRIES = 3
+# Longest Retry-After we will sleep through; a tool call waiting longer would
+# hold its agent slot, so anything above this fails the call instead
+_MAX_RETRY_AFTER = 30
+
+
+class _TokenBucket:
+    """Async token bucket: allows short bursts, then paces callers to a steady rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                # Hold the lock while waiting so callers are served in order
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._updated = time.monotonic()
+                self._tokens = 1
+            self._tokens -= 1
+
+
+_rate_limiter = _TokenBucket(rate=_REQUESTS_PER_SECOND, capacity=_REQUESTS_PER_SECOND)
+
+
+@lru_cache(maxsize=8)
+def _auth_headers(token: str) -> Dict[str, str]:
+    """Authorization header for a token, built once per token.
+
+    Access tokens rotate hourly, so a handful of slots is enough; stale tokens
+    simply age out. Callers must not mutate the returned dict.
+    """
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def aclose() -> None:
+    """Close the shared client's pooled connections (called on app shutdown)."""
+    await _client.aclose()
+
+
+async def _send(
+    token: str,
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]],
+    json: Optional[Dict[str, Any]],
+) -> httpx.Response:
+    """Send one request, pacing it and retrying while Spotify answers 429."""
+    for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+        await _rate_limiter.acquire()
+        response = await _client.request(
+            method,
+            path,
+            params=params,
+            json=json,
+            headers=_auth_headers(token),
+        )
+        if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+            break
+        try:
+            retry_after = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            retry_after = float("inf")
+        if retry_after > _MAX_RETRY_AFTER:
+            logger.warning(
+                "Spotify asked to wait %ss on %s %s, giving up",
+                response.headers.get("Retry-After"),
+                method,
+                path,
+            )
+            break
+        logger.warning(
+            "Spotify rate limit hit on %s %s, retrying in %ss",
+            method,
+            path,
+            retry_after,
+        )
+        await asyncio.sleep(retry_after)
+    return response
+
+
+async def spotify_request(
+    token: str,
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Dict[str, Any]] = None,
+    refresh_token: Optional[Callable[[], Awaitable[str]]] = None,
+) -> Dict[str, Any]:
+    """Call a Spotify Web API endpoint and return the decoded JSON body.
+
+    If Spotify rejects the token with a 401 and ``refresh_token`` is given, a
+    fresh token is fetched from it and the call is retried once; tokens expire
+    hourly, which a long agent run can cross.
+    """
+    response = await _send(token, method, path, params, json)
+    if response.status_code == 401 and refresh_token is not None:
+        logger.info("Spotify token rejected on %s %s, refreshing", method, path)
+        response = await _send(await refresh_token(), method, path, params, json)
+    response.raise_for_status()
+    # orjson decodes large playlist/search payloads several times faster than stdlib json
+    return orjson.loads(response.content)
+
+
+async def spotify_get(
+    token: str, path: str, params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """GET a Spotify Web API endpoint and return the decoded JSON body."""
+    return await spotify_request(token, "GET", path, params=params)
@@ -2,6 +2,7 @@
 Spotify service for managing the dedicated service account
 """
 
+import asyncio
 import logging
 import os
 from typing import Optional, Dict, Any
@@ -51,6 +52,13 @@ class SpotifyServiceClient:
 
     async def _build_client(self) -> spotipy.Spotify:
         """Instantiate a Spotipy client and save it on the instance."""
+        # Construction writes the seed token to the cache; keep that blocking
+        # I/O off the event loop
+        self._client = await asyncio.to_thread(self._create_client)
+        return self._client
+
+    def _create_client(self) -> spotipy.Spotify:
+        """Create a Spotipy client authenticated with the service account's refresh token."""
         import redis
 
         redis_client = redis.from_url(
@@ -73,8 +81,7 @@ class SpotifyServiceClient:
         }
         sp_oauth.cache_handler.save_token_to_cache(token_info)
 
-        self._client = spotipy.Spotify(auth_manager=sp_oauth)
-        return self._client
+        return spotipy.Spotify(auth_manager=sp_oauth)
 
     async def get_client(self) -> spotipy.Spotify:
         """Return a cached client; build it once if necessary."""
@@ -82,6 +89,12 @@ class SpotifyServiceClient:
             await self._build_client()
         return self._client
 
+    async def get_access_token(self) -> str:
+        """Return a valid access token for direct Web API calls, refreshing it if expired."""
+        client = await self.get_client()
+        token_info = await asyncio.to_thread(client.auth_manager.get_cached_token)
+        return token_info["access_token"]
+
 
 # Global service client instance
 spotify_service = SpotifyServiceClient()
@@ -6,6 +6,21 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from langchain_core.runnables import RunnableConfig
 
+from app.langgraph_agent import tools
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_caches():
+    """Keep the process-wide tool caches from leaking between tests"""
+    tools._track_cache.clear()
+    tools._artist_cache.clear()
+    tools._top_tracks_cache.clear()
+    tools._track_details.clear()
+    tools.playlist_cache.clear()
+    tools._available_genres = None
+    tools.clear_user_info_cache()
+    yield
+
 
 @pytest.fixture
 def mock_spotify_client():
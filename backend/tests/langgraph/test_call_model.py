@@ -0,0 +1,40 @@
+"""
+Test suite for the agent's call_model node
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from app.langgraph_agent import agent
+
+
+class TestCallModelSummaryTask:
+    """Test suite for the summarization task started by call_model"""
+
+    @pytest.mark.asyncio
+    async def test_call_model_cancels_summary_when_model_setup_fails(self, monkeypatch):
+        """Test that a failing model setup doesn't orphan the summarization task"""
+        # Arrange
+        cancelled = []
+
+        async def slow_compress(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        monkeypatch.setattr(agent, "acompress_history", slow_compress)
+        monkeypatch.setattr(
+            agent, "ChatOpenAI", Mock(side_effect=[Mock(), RuntimeError("bad model")])
+        )
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await agent.call_model(
+                {"messages": [HumanMessage(content="hi")]}, {"configurable": {}}
+            )
+        assert cancelled == [True]
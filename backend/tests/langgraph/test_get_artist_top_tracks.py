@@ -9,7 +9,8 @@ from app.langgraph_agent.tools import get_artist_top_tracks
 class TestGetArtistTopTracks:
     """Test suite for get_artist_top_tracks tool"""
 
-    def test_get_artist_top_tracks_successful(
+    @pytest.mark.asyncio
+    async def test_get_artist_top_tracks_successful(
         self, config_with_spotify_client, mock_spotify_client
     ):
         """Test successful retrieval of artist top tracks"""
@@ -18,7 +19,7 @@ class TestGetArtistTopTracks:
         country = "US"
 
         # Act
-        result = get_artist_top_tracks.invoke(
+        result = await get_artist_top_tracks.ainvoke(
             {"artist_id": artist_id, "country": country}, config_with_spotify_client
         )
 
@@ -36,7 +37,8 @@ class TestGetArtistTopTracks:
             artist_id, country=country
         )
 
-    def test_get_artist_top_tracks_default_country(
+    @pytest.mark.asyncio
+    async def test_get_artist_top_tracks_default_country(
         self, config_with_spotify_client, mock_spotify_client
     ):
         """Test get_artist_top_tracks with default country"""
@@ -44,7 +46,7 @@ class TestGetArtistTopTracks:
         artist_id = "test_artist_456"
 
         # Act
-        result = get_artist_top_tracks.invoke(
+        result = await get_artist_top_tracks.ainvoke(
             {"artist_id": artist_id}, config_with_spotify_client
         )
 
@@ -54,18 +56,22 @@ class TestGetArtistTopTracks:
             artist_id, country="US"
         )
 
-    def test_get_artist_top_tracks_no_spotify_client(self, empty_config):
+    @pytest.mark.asyncio
+    async def test_get_artist_top_tracks_no_spotify_client(self, empty_config):
         """Test get_artist_top_tracks when no Spotify client is provided"""
         # Arrange
         artist_id = "test_artist"
 
         # Act
-        result = get_artist_top_tracks.invoke({"artist_id": artist_id}, empty_config)
+        result = await get_artist_top_tracks.ainvoke(
+            {"artist_id": artist_id}, empty_config
+        )
 
         # Assert
         assert result == []
 
-    def test_get_artist_top_tracks_api_error(
+    @pytest.mark.asyncio
+    async def test_get_artist_top_tracks_api_error(
         self, config_with_spotify_client, mock_spotify_client
     ):
         """Test get_artist_top_tracks when Spotify API throws an error"""
@@ -74,14 +80,15 @@ class TestGetArtistTopTracks:
         mock_spotify_client.artist_top_tracks.side_effect = Exception("API error")
 
         # Act
-        result = get_artist_top_tracks.invoke(
+        result = await get_artist_top_tracks.ainvoke(
             {"artist_id": artist_id}, config_with_spotify_client
         )
 
         # Assert
         assert result == []
 
-    def test_get_artist_top_tracks_different_countries(
+    @pytest.mark.asyncio
+    async def test_get_artist_top_tracks_different_countries(
         self, config_with_spotify_client, mock_spotify_client
     ):
         """Test get_artist_top_tracks with different countries"""
@@ -90,7 +97,7 @@ class TestGetArtistTopTracks:
 
         for country in ["US", "UK", "CA", "AU"]:
             # Act
-            result = get_artist_top_tracks.invoke(
+            result = await get_artist_top_tracks.ainvoke(
                 {"artist_id": artist_id, "country": country}, config_with_spotify_client
             )
 
@@ -0,0 +1,62 @@
+"""
+Test suite for the get_audio_features_batch tool
+"""
+
+import pytest
+
+from app.langgraph_agent.tools import get_audio_features_batch
+
+
+class TestGetAudioFeaturesBatch:
+    """Test suite for get_audio_features_batch tool"""
+
+    @pytest.mark.asyncio
+    async def test_get_audio_features_batch_maps_ids_to_features(
+        self, config_with_spotify_client, mock_spotify_client
+    ):
+        """Test that features are returned per track ID in one request"""
+        # Arrange
+        mock_spotify_client.audio_features.return_value = [
+            {"id": "track1", "energy": 0.8},
+            None,
+        ]
+
+        # Act
+        result = await get_audio_features_batch.ainvoke(
+            {"track_ids": ["track1", "track2", "track1"]}, config_with_spotify_client
+        )
+
+        # Assert
+        assert result == {"track1": {"id": "track1", "energy": 0.8}, "track2": None}
+        mock_spotify_client.audio_features.assert_called_once_with(["track1", "track2"])
+
+    @pytest.mark.asyncio
+    async def test_get_audio_features_batch_splits_into_batches_of_100(
+        self, config_with_spotify_client, mock_spotify_client
+    ):
+        """Test that more than 100 IDs are split across requests"""
+        # Arrange
+        track_ids = [f"track{i}" for i in range(150)]
+        mock_spotify_client.audio_features.side_effect = lambda ids: [
+            {"id": track_id} for track_id in ids
+        ]
+
+        # Act
+        result = await get_audio_features_batch.ainvoke(
+            {"track_ids": track_ids}, config_with_spotify_client
+        )
+
+        # Assert
+        assert len(result) == 150
+        assert mock_spotify_client.audio_features.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_audio_features_batch_no_spotify_client(self, empty_config):
+        """Test get_audio_features_batch when no Spotify client is provided"""
+        # Act
+        result = await get_audio_features_batch.ainvoke(
+            {"track_ids": ["track1"]}, empty_config
+        )
+
+        # Assert
+        assert result == {}
@@ -0,0 +1,196 @@
+"""
+Test suite for conversation history compaction
+"""
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langmem.short_term import RunningSummary
+
+from app.langgraph_agent import memory
+
+
+def _conversation(turns, chars=6_000):
+    """Build alternating user/assistant turns with stable IDs"""
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"request {i} " + "x" * chars, id=f"h{i}"))
+        messages.append(AIMessage(content=f"reply {i} " + "y" * chars, id=f"a{i}"))
+    return messages
+
+
+@pytest.fixture
+def low_trigger(monkeypatch):
+    """Trigger compaction on any history, whatever tokenizer is available"""
+    monkeypatch.setattr(memory, "SUMMARIZATION_TRIGGER_TOKENS", 1)
+
+
+@pytest.fixture
+def encoder_unavailable(monkeypatch):
+    """Make tiktoken fail to load, as it does offline without a cached BPE file"""
+
+    def fail(name):
+        raise ConnectionError("no network")
+
+    memory._encoder.cache_clear()
+    monkeypatch.setattr(memory.tiktoken, "get_encoding", fail)
+    yield
+    memory._encoder.cache_clear()
+
+
+class TestCompactionGate:
+    """Test suite for the token threshold that triggers compaction"""
+
+    @pytest.mark.asyncio
+    async def test_compaction_gate_without_encoder(self, encoder_unavailable):
+        """Test that a long history is still compacted when tiktoken can't load"""
+        # Arrange
+        model = FakeListChatModel(responses=["the summary"])
+        messages = _conversation(turns=8)
+
+        # Act
+        result = await memory.acompress_history(
+            messages, running_summary=None, model=model
+        )
+
+        # Assert
+        assert result.running_summary is not None
+        assert result.running_summary.summary == "the summary"
+        assert len(result.messages) < len(messages)
+
+    @pytest.mark.asyncio
+    async def test_short_history_not_compacted_without_encoder(
+        self, encoder_unavailable
+    ):
+        """Test that the fallback estimate keeps short histories untouched"""
+        # Arrange
+        model = FakeListChatModel(responses=["unused"])
+        messages = [SystemMessage(content="system")] + _conversation(turns=8, chars=10)
+
+        # Act
+        result = await memory.acompress_history(
+            messages, running_summary=None, model=model
+        )
+
+        # Assert
+        assert result.running_summary is None
+        assert result.messages == messages
+
+
+class TestGroupMessages:
+    """Test suite for splitting history into selection units"""
+
+    def test_group_messages_keeps_tool_results_with_their_call(self):
+        """Test that tool results stay in the unit of the message that called them"""
+        # Arrange
+        call = AIMessage(
+            content="",
+            tool_calls=[{"name": "search_tracks", "args": {}, "id": "call1"}],
+            id="a0",
+        )
+        result = ToolMessage(content="[]", tool_call_id="call1", id="t0")
+        messages = [HumanMessage(content="hi", id="h0"), call, result]
+
+        # Act
+        groups = memory._group_messages(messages)
+
+        # Assert
+        assert groups == [[messages[0]], [call, result]]
+
+
+class TestCompressHistory:
+    """Test suite for acompress_history"""
+
+    @pytest.mark.asyncio
+    async def test_compress_history_summarizes_only_the_middle(self, low_trigger):
+        """Test that head and tail stay verbatim around the summary"""
+        # Arrange
+        model = FakeListChatModel(responses=["the summary"])
+        system = SystemMessage(content="system", id="s")
+        messages = [system] + _conversation(turns=4, chars=10)
+
+        # Act
+        result = await memory.acompress_history(
+            messages, running_summary=None, model=model
+        )
+
+        # Assert
+        head = messages[1 : 1 + memory.KEEP_FIRST_GROUPS]
+        tail = messages[-memory.KEEP_LAST_GROUPS :]
+        summary = result.messages[1 + len(head)]
+        assert result.messages[: 1 + len(head)] == [system] + head
+        assert isinstance(summary, SystemMessage)
+        assert "the summary" in summary.content
+        assert result.messages[2 + len(head) :] == tail
+
+    @pytest.mark.asyncio
+    async def test_compress_history_records_summarized_ids(self, low_trigger):
+        """Test that summarized IDs accumulate across compactions"""
+        # Arrange
+        model = FakeListChatModel(responses=["the summary"])
+        messages = _conversation(turns=4, chars=10)
+        previous = RunningSummary(
+            summary="older",
+            summarized_message_ids={"old"},
+            last_summarized_message_id="old",
+        )
+        middle = messages[memory.KEEP_FIRST_GROUPS : -memory.KEEP_LAST_GROUPS]
+
+        # Act
+        result = await memory.acompress_history(
+            messages, running_summary=previous, model=model, cache_reset_turns=0
+        )
+
+        # Assert
+        assert result.running_summary.summarized_message_ids == {"old"} | {
+            m.id for m in middle
+        }
+        assert result.running_summary.last_summarized_message_id == middle[-1].id
+
+    @pytest.mark.asyncio
+    async def test_compress_history_waits_for_cache_reset_turns(self, low_trigger):
+        """Test that a recent compaction is reused until enough turns pass"""
+        # Arrange
+        model = FakeListChatModel(responses=["unused"])
+        messages = _conversation(turns=4, chars=10)
+        middle = messages[memory.KEEP_FIRST_GROUPS : -memory.KEEP_LAST_GROUPS]
+        previous = RunningSummary(
+            summary="older",
+            summarized_message_ids={m.id for m in middle},
+            last_summarized_message_id=middle[-1].id,
+        )
+        # Two new user turns after the kept tail, fewer than required
+        messages += _conversation(turns=6, chars=10)[-4:]
+
+        # Act
+        result = await memory.acompress_history(
+            messages, running_summary=previous, model=model, cache_reset_turns=3
+        )
+
+        # Assert
+        assert result.running_summary is previous
+        assert result.messages == memory.apply_running_summary(messages, previous)
+        assert not any(m.id in previous.summarized_message_ids for m in result.messages)
+
+    def test_apply_running_summary_places_summary_after_head(self):
+        """Test that the summary sits between the first turn and the rest"""
+        # Arrange
+        messages = _conversation(turns=3, chars=10)
+        previous = RunningSummary(
+            summary="older",
+            summarized_message_ids={"a0"},
+            last_summarized_message_id="a0",
+        )
+
+        # Act
+        result = memory.apply_running_summary(messages, previous)
+
+        # Assert
+        assert result[0] is messages[0]
+        assert "older" in result[1].content
+        assert result[2:] == messages[2:]
@@ -0,0 +1,51 @@
+"""
+Test suite for invalidating the /api/playlist cache from playlist-editing tools
+"""
+
+import pytest
+
+from app.langgraph_agent.tools import (
+    add_tracks_to_playlist,
+    playlist_cache,
+    remove_tracks_from_playlist,
+)
+
+
+class TestPlaylistCacheInvalidation:
+    """Test suite for playlist cache invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_add_tracks_to_playlist_drops_cached_playlist(
+        self, config_with_spotify_client
+    ):
+        """Test that adding tracks invalidates the cached playlist"""
+        # Arrange
+        await playlist_cache.set("playlist123", {"id": "playlist123", "tracks": []})
+
+        # Act
+        await add_tracks_to_playlist.ainvoke(
+            {"playlist_id": "playlist123", "track_uris": ["spotify:track:track1"]},
+            config_with_spotify_client,
+        )
+
+        # Assert
+        assert await playlist_cache.get("playlist123") is None
+
+    @pytest.mark.asyncio
+    async def test_remove_tracks_from_playlist_drops_cached_playlist(
+        self, config_with_spotify_client, mock_spotify_client
+    ):
+        """Test that removing tracks invalidates the cached playlist"""
+        # Arrange
+        await playlist_cache.set("playlist123", {"id": "playlist123", "tracks": []})
+
+        # Act
+        result = await remove_tracks_from_playlist.ainvoke(
+            {"playlist_id": "playlist123", "track_uris": ["spotify:track:track1"]},
+            config_with_spotify_client,
+        )
+
+        # Assert
+        assert result is True
+        assert await playlist_cache.get("playlist123") is None
+        mock_spotify_client.playlist_remove_all_occurrences_of_items.assert_called_once()
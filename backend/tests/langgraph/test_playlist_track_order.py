@@ -0,0 +1,137 @@
+"""
+Test suite for track order and completeness in the playlist tools
+"""
+
+import time
+
+import pytest
+
+from app.langgraph_agent.tools import (
+    add_tracks_to_playlist,
+    create_and_populate_playlist,
+    get_playlist_tracks,
+)
+
+
+def _track(uri):
+    """Minimal Spotify track object for a URI"""
+    track_id = uri.rsplit(":", 1)[1]
+    return {
+        "id": track_id,
+        "name": f"Track {track_id}",
+        "artists": [{"name": "Artist"}],
+        "album": {"name": "Album", "images": []},
+        "uri": uri,
+        "duration_ms": 200000,
+    }
+
+
+@pytest.fixture
+def stored_uris(mock_spotify_client):
+    """Back the mock client with a playlist whose first upload is the slowest"""
+    stored = []
+    calls = []
+
+    def add_items(playlist_id, uris):
+        # The first chunk finishing last would shuffle concurrent uploads
+        calls.append(uris)
+        if len(calls) == 1:
+            time.sleep(0.05)
+        stored.extend(uris)
+        return {"snapshot_id": "abc123"}
+
+    def page(limit, offset):
+        return {
+            "items": [
+                {"track": _track(uri)} for uri in stored[offset : offset + limit]
+            ],
+            "total": len(stored),
+        }
+
+    def playlist(playlist_id, fields=None):
+        return {
+            "id": playlist_id,
+            "name": "Test Playlist",
+            "description": "",
+            "public": True,
+            "collaborative": False,
+            "owner": {"display_name": "Test User"},
+            "images": [],
+            "tracks": page(100, 0),
+        }
+
+    mock_spotify_client.playlist_add_items.side_effect = add_items
+    mock_spotify_client.playlist.side_effect = playlist
+    mock_spotify_client.playlist_tracks.side_effect = (
+        lambda playlist_id, fields=None, limit=100, offset=0: page(limit, offset)
+    )
+    return stored
+
+
+class TestAddTracksToPlaylistOrder:
+    """Test suite for track order in add_tracks_to_playlist"""
+
+    @pytest.mark.asyncio
+    async def test_add_tracks_to_playlist_keeps_order_across_chunks(
+        self, config_with_spotify_client, stored_uris
+    ):
+        """Test that more than 100 tracks end up in the order they were given"""
+        # Arrange
+        track_uris = [f"spotify:track:t{i}" for i in range(250)]
+
+        # Act
+        result = await add_tracks_to_playlist.ainvoke(
+            {"playlist_id": "playlist123", "track_uris": track_uris},
+            config_with_spotify_client,
+        )
+
+        # Assert
+        assert stored_uris == track_uris
+        assert [track["uri"] for track in result["tracks"]] == track_uris
+
+
+class TestCreateAndPopulatePlaylistOrder:
+    """Test suite for track order in create_and_populate_playlist"""
+
+    @pytest.mark.asyncio
+    async def test_create_and_populate_playlist_keeps_order_across_chunks(
+        self, config_with_spotify_client, mock_spotify_client, stored_uris
+    ):
+        """Test that the playlist and the returned tracks follow the given order"""
+        # Arrange
+        track_uris = [f"spotify:track:t{i}" for i in range(250)]
+        mock_spotify_client.tracks.side_effect = lambda ids: {
+            "tracks": [_track(f"spotify:track:{track_id}") for track_id in ids]
+        }
+
+        # Act
+        result = await create_and_populate_playlist.ainvoke(
+            {"name": "Ordered", "track_uris": track_uris},
+            config_with_spotify_client,
+        )
+
+        # Assert
+        assert stored_uris == track_uris
+        assert [track["uri"] for track in result["tracks"]] == track_uris
+
+
+class TestGetPlaylistTracksPaging:
+    """Test suite for reading whole playlists with get_playlist_tracks"""
+
+    @pytest.mark.asyncio
+    async def test_get_playlist_tracks_returns_every_page_by_default(
+        self, config_with_spotify_client, stored_uris
+    ):
+        """Test that playlists over 100 tracks are returned in full and in order"""
+        # Arrange
+        track_uris = [f"spotify:track:t{i}" for i in range(250)]
+        stored_uris.extend(track_uris)
+
+        # Act
+        result = await get_playlist_tracks.ainvoke(
+            {"playlist_id": "playlist123"}, config_with_spotify_client
+        )
+
+        # Assert
+        assert [track["uri"] for track in result["tracks"]] == track_uris
+        assert result["total_tracks"] == 250
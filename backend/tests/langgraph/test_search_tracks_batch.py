@@ -0,0 +1,73 @@
+"""
+Test suite for the search_tracks_batch tool
+"""
+
+import pytest
+
+from app.langgraph_agent.tools import search_tracks_batch
+
+
+class TestSearchTracksBatch:
+    """Test suite for search_tracks_batch tool"""
+
+    @pytest.mark.asyncio
+    async def test_search_tracks_batch_returns_results_per_query(
+        self, config_with_spotify_client, mock_spotify_client
+    ):
+        """Test that each query maps to its own track list"""
+        # Arrange
+        queries = ["first song", "second song"]
+
+        # Act
+        result = await search_tracks_batch.ainvoke(
+            {"queries": queries}, config_with_spotify_client
+        )
+
+        # Assert
+        assert list(result.keys()) == queries
+        assert all(len(tracks) == 2 for tracks in result.values())
+        assert mock_spotify_client.search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_tracks_batch_deduplicates_queries(
+        self, config_with_spotify_client, mock_spotify_client
+    ):
+        """Test that repeated queries are only searched once"""
+        # Arrange
+        queries = ["same song", "same song", "same song"]
+
+        # Act
+        result = await search_tracks_batch.ainvoke(
+            {"queries": queries}, config_with_spotify_client
+        )
+
+        # Assert
+        assert list(result.keys()) == ["same song"]
+        mock_spotify_client.search.assert_called_once_with(
+            q="same song", type="track", limit=20, market="US"
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_tracks_batch_no_spotify_client(self, empty_config):
+        """Test search_tracks_batch when no Spotify client is provided"""
+        # Act
+        result = await search_tracks_batch.ainvoke(
+            {"queries": ["test song"]}, empty_config
+        )
+
+        # Assert
+        assert result == {"test song": []}
+
+    @pytest.mark.asyncio
+    async def test_search_tracks_batch_skips_blank_queries(
+        self, config_with_spotify_client, mock_spotify_client
+    ):
+        """Test that blank queries return no tracks without calling Spotify"""
+        # Act
+        result = await search_tracks_batch.ainvoke(
+            {"queries": ["", "   "]}, config_with_spotify_client
+        )
+
+        # Assert
+        assert result == {"": [], "   ": []}
+        mock_spotify_client.search.assert_not_called()
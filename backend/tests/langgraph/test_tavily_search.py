@@ -0,0 +1,44 @@
+"""
+Test suite for the tavily_search cache key
+"""
+
+from app.langgraph_agent.tools import _tavily_query_key
+
+
+class TestTavilyQueryKey:
+    """Test suite for _tavily_query_key"""
+
+    def test_tavily_query_key_ignores_case_punctuation_and_stopwords(self):
+        """Test that trivially different phrasings share a key"""
+        # Act
+        first = _tavily_query_key("Popular songs of 2008?")
+        second = _tavily_query_key("popular songs 2008")
+
+        # Assert
+        assert first == second == "popular songs 2008"
+
+    def test_tavily_query_key_keeps_word_order(self):
+        """Test that reordered queries with different meanings get different keys"""
+        # Act
+        drake = _tavily_query_key("Drake songs featuring Rihanna")
+        rihanna = _tavily_query_key("Rihanna songs featuring Drake")
+
+        # Assert
+        assert drake != rihanna
+
+    def test_tavily_query_key_distinguishes_sampled_by(self):
+        """Test that "sampled by" and "songs sampled" queries stay apart"""
+        # Act
+        sampled_by = _tavily_query_key("songs sampled by Daft Punk")
+        daft_punk_samples = _tavily_query_key("Daft Punk songs sampled")
+
+        # Assert
+        assert sampled_by != daft_punk_samples
+
+    def test_tavily_query_key_only_stopwords(self):
+        """Test that a query made only of stopwords still gets a key"""
+        # Act
+        key = _tavily_query_key("The And")
+
+        # Assert
+        assert key == "the and"
@@ -0,0 +1,52 @@
+"""
+Test suite for the get_user_info cache
+"""
+
+from unittest.mock import Mock
+
+from langchain_core.runnables import RunnableConfig
+
+from app.langgraph_agent.tools import get_user_info
+
+
+class TestUserInfoCache:
+    """Test suite for caching user info per account"""
+
+    def test_get_user_info_cached_per_user(self, mock_spotify_client):
+        """Test that repeated calls for one user hit Spotify once"""
+        # Arrange
+        config = RunnableConfig(
+            configurable={"spotify_client": mock_spotify_client, "user_id": "u1"}
+        )
+
+        # Act
+        first = get_user_info.invoke({}, config)
+        second = get_user_info.invoke({}, config)
+
+        # Assert
+        assert first == second
+        mock_spotify_client.current_user.assert_called_once()
+
+    def test_get_user_info_not_shared_between_users(self, mock_spotify_client):
+        """Test that another account never receives a cached profile"""
+        # Arrange
+        other_client = Mock()
+        other_client.current_user.return_value = {"id": "other", "display_name": "O"}
+        get_user_info.invoke(
+            {},
+            RunnableConfig(
+                configurable={"spotify_client": mock_spotify_client, "user_id": "u1"}
+            ),
+        )
+
+        # Act
+        result = get_user_info.invoke(
+            {},
+            RunnableConfig(
+                configurable={"spotify_client": other_client, "user_id": "u2"}
+            ),
+        )
+
+        # Assert
+        assert result["id"] == "other"
+        other_client.current_user.assert_called_once()
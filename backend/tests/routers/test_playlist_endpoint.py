@@ -0,0 +1,90 @@
+"""
+Test suite for GET /api/playlist/{playlist_id} caching
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.routers import api
+
+
+@pytest.fixture
+def service_account(monkeypatch):
+    """Replace the service account so tests can see when it is consulted"""
+    service = Mock()
+    service.get_client = AsyncMock(return_value=Mock())
+    service.get_access_token = AsyncMock(return_value="token")
+    monkeypatch.setattr(api, "spotify_service", service)
+    return service
+
+
+@pytest.fixture
+def slow_fetch(monkeypatch):
+    """Hold get_playlist_tracks open until the test releases it"""
+    started = asyncio.Event()
+    release = asyncio.Event()
+    playlist = {"id": "playlist123", "tracks": []}
+
+    async def ainvoke(args, config):
+        started.set()
+        await release.wait()
+        return playlist
+
+    monkeypatch.setattr(api, "get_playlist_tracks", Mock(ainvoke=ainvoke))
+    return started, release, playlist
+
+
+class TestGetPlaylistCache:
+    """Test suite for serving playlists from the cache"""
+
+    @pytest.mark.asyncio
+    async def test_get_playlist_cache_hit_skips_service_account(self, service_account):
+        """Test that a cached playlist is returned without fetching credentials"""
+        # Arrange
+        playlist = {"id": "playlist123", "tracks": []}
+        await api.playlist_cache.set("playlist123", playlist)
+
+        # Act
+        result = await api.get_playlist("playlist123")
+
+        # Assert
+        assert result == playlist
+        service_account.get_client.assert_not_awaited()
+        service_account.get_access_token.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_load_playlist_caches_fetched_playlist(
+        self, service_account, slow_fetch
+    ):
+        """Test that a fetched playlist is cached for the next request"""
+        # Arrange
+        started, release, playlist = slow_fetch
+        release.set()
+
+        # Act
+        result = await api._load_playlist("playlist123")
+
+        # Assert
+        assert result == playlist
+        assert await api.playlist_cache.get("playlist123") == playlist
+
+    @pytest.mark.asyncio
+    async def test_load_playlist_skips_cache_after_invalidation_in_flight(
+        self, service_account, slow_fetch
+    ):
+        """Test that a playlist edited during the fetch is not cached stale"""
+        # Arrange
+        started, release, playlist = slow_fetch
+        load = asyncio.create_task(api._load_playlist("playlist123"))
+        await started.wait()
+
+        # Act
+        await api.playlist_cache.delete("playlist123")
+        release.set()
+        result = await load
+
+        # Assert
+        assert result == playlist
+        assert await api.playlist_cache.get("playlist123") is None
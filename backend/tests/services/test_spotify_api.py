@@ -0,0 +1,165 @@
+"""
+Test suite for the async Spotify Web API client
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import spotify_api
+
+
+@pytest.fixture
+def spotify_responses(monkeypatch):
+    """Serve queued responses from a mock transport and record the requests"""
+    queued = []
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return queued.pop(0)
+
+    monkeypatch.setattr(
+        spotify_api,
+        "_client",
+        httpx.AsyncClient(
+            base_url=spotify_api.SPOTIFY_API_BASE_URL,
+            transport=httpx.MockTransport(handler),
+        ),
+    )
+    monkeypatch.setattr(
+        spotify_api, "_rate_limiter", spotify_api._TokenBucket(rate=1000, capacity=100)
+    )
+    return queued, requests
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested sleeps instead of waiting them out"""
+    recorded = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(spotify_api.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+class TestTokenRefresh:
+    """Test suite for retrying a request with a refreshed token"""
+
+    @pytest.mark.asyncio
+    async def test_spotify_request_retries_once_with_fresh_token(
+        self, spotify_responses
+    ):
+        """Test that a 401 fetches a new token and repeats the call"""
+        # Arrange
+        queued, requests = spotify_responses
+        queued += [httpx.Response(401), httpx.Response(200, json={"id": "user"})]
+
+        async def refresh_token():
+            return "fresh"
+
+        # Act
+        result = await spotify_api.spotify_request(
+            "expired", "GET", "/me", refresh_token=refresh_token
+        )
+
+        # Assert
+        assert result == {"id": "user"}
+        assert [r.headers["Authorization"] for r in requests] == [
+            "Bearer expired",
+            "Bearer fresh",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_spotify_request_raises_401_without_refresher(
+        self, spotify_responses
+    ):
+        """Test that a 401 is raised when no token provider is given"""
+        # Arrange
+        queued, requests = spotify_responses
+        queued.append(httpx.Response(401))
+
+        # Act & Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            await spotify_api.spotify_request("expired", "GET", "/me")
+        assert len(requests) == 1
+
+
+class TestRateLimitRetry:
+    """Test suite for honouring Retry-After on 429 responses"""
+
+    @pytest.mark.asyncio
+    async def test_spotify_request_retries_after_429(self, spotify_responses, sleeps):
+        """Test that a 429 is waited out and the call then succeeds"""
+        # Arrange
+        queued, requests = spotify_responses
+        queued += [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"id": "user"}),
+        ]
+
+        # Act
+        result = await spotify_api.spotify_request("token", "GET", "/me")
+
+        # Assert
+        assert result == {"id": "user"}
+        assert sleeps == [2.0]
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_spotify_request_gives_up_on_long_retry_after(
+        self, spotify_responses, sleeps
+    ):
+        """Test that a Retry-After above the cap fails the call without sleeping"""
+        # Arrange
+        queued, requests = spotify_responses
+        retry_after = str(spotify_api._MAX_RETRY_AFTER + 1)
+        queued.append(httpx.Response(429, headers={"Retry-After": retry_after}))
+
+        # Act & Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            await spotify_api.spotify_request("token", "GET", "/me")
+        assert sleeps == []
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_spotify_request_gives_up_on_unparsable_retry_after(
+        self, spotify_responses, sleeps
+    ):
+        """Test that a non-numeric Retry-After fails the call without sleeping"""
+        # Arrange
+        queued, requests = spotify_responses
+        queued.append(
+            httpx.Response(
+                429, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+            )
+        )
+
+        # Act & Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            await spotify_api.spotify_request("token", "GET", "/me")
+        assert sleeps == []
+        assert len(requests) == 1
+
+
+class TestTokenBucket:
+    """Test suite for the request pacing token bucket"""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_calls_after_burst(self, sleeps):
+        """Test that calls beyond the burst capacity wait for a token"""
+        # Arrange
+        bucket = spotify_api._TokenBucket(rate=10, capacity=2)
+
+        # Act
+        for _ in range(4):
+            await bucket.acquire()
+
+        # Assert
+        assert len(sleeps) == 2
+        assert all(0 < delay <= 1 / bucket.rate for delay in sleeps)